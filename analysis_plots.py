@@ -1,42 +1,168 @@
-import matplotlib.pyplot as plt
 import numpy as np
-from typing import Dict, List
+from typing import Dict, Iterator, List, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor
 import json
+import os
+import sys
 
-def plot_performance_comparison(results: Dict, depth: int):
-    """Gera gráficos comparativos de desempenho"""
+
+def _pyplot(show: bool):
+    """Importa o matplotlib só quando um gráfico é pedido
+    
+    Sem exibição (show=False) ou sem terminal gráfico, usa o backend Agg, que
+    não abre janelas.
+    """
+    if 'matplotlib.pyplot' not in sys.modules:
+        import matplotlib
+        headless = sys.platform.startswith('linux') and not os.environ.get('DISPLAY')
+        if (not show or headless) and 'MPLBACKEND' not in os.environ:
+            matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    return plt
+
+
+def _finish_figure(plt, fig, filename: str, show: bool, dpi: int):
+    """Salva a figura e a exibe ou libera"""
+    plt.tight_layout()
+    fig.savefig(filename, dpi=dpi, bbox_inches='tight')
+    print(f"Gráfico salvo: {filename}")
+    if show:
+        plt.show()
+    else:
+        plt.close(fig)
+
+# Nomes dos agentes nas chaves de configuração ('<agente X>_vs_<agente O>')
+AGENT_NAMES = {'minimax': 'Minimax', 'alphabeta': 'Alpha-Beta', 'mcts': 'MCTS', 'pvs': 'PVS'}
+
+COLUMN_NAMES = ('config', 'agent', 'side', 'depth', 'time', 'nodes', 'winner')
+
+
+def _config_agents(config: str) -> Tuple[str, str]:
+    """Agentes de X e de O de uma configuração"""
+    x_key, o_key = config.split('_vs_')
+    return AGENT_NAMES.get(x_key, x_key), AGENT_NAMES.get(o_key, o_key)
+
+
+def _build_columns(rows: List[Tuple[str, Dict, int]]) -> Dict[str, np.ndarray]:
+    """Colunas de uma lista de (configuração, resultado, profundidade): duas linhas por partida"""
+    n = len(rows)
+    configs = np.empty(2 * n, dtype=object)
+    agents = np.empty(2 * n, dtype=object)
+    sides = np.empty(2 * n, dtype='<U1')
+    depths = np.empty(2 * n, dtype=np.int16)
+    times = np.empty(2 * n, dtype=np.float64)
+    nodes = np.empty(2 * n, dtype=np.int64)
+    winners = np.empty(2 * n, dtype='<U6')
+    for i, (config, result, depth) in enumerate(rows):
+        x_agent, o_agent = _config_agents(config)
+        j = 2 * i
+        configs[j] = configs[j + 1] = config
+        agents[j], agents[j + 1] = x_agent, o_agent
+        sides[j], sides[j + 1] = 'X', 'O'
+        depths[j] = depths[j + 1] = depth
+        times[j], times[j + 1] = result['time_X'], result['time_O']
+        nodes[j], nodes[j + 1] = result['nodes_X'], result['nodes_O']
+        winners[j] = winners[j + 1] = result['winner']
+    return {'config': configs.astype(str), 'agent': agents.astype(str), 'side': sides,
+            'depth': depths, 'time': times, 'nodes': nodes, 'winner': winners}
+
+
+def concat_columns(parts: List[Dict[str, np.ndarray]]) -> Dict[str, np.ndarray]:
+    """Concatena conjuntos de colunas"""
+    if not parts:
+        return _build_columns([])
+    return {name: np.concatenate([part[name] for part in parts]) for name in COLUMN_NAMES}
+
+
+def load_columns(results: Dict, depth: int = 0) -> Dict[str, np.ndarray]:
+    """Converte um dicionário de resultados ({config: [resultado]}) em colunas NumPy
+    
+    Cada partida vira duas linhas, uma por lado: config, agent, side ('X'/'O'),
+    depth, time, nodes e winner ('X', 'O' ou 'Empate').
+    """
+    return _build_columns([(config, game, depth)
+                           for config, games in results.items() for game in games])
+
+
+def load_columns_by_depth(results_by_depth: Dict[int, Dict]) -> Dict[str, np.ndarray]:
+    """Colunas de vários experimentos indexados pela profundidade"""
+    return concat_columns([load_columns(results, depth)
+                           for depth, results in results_by_depth.items()])
+
+
+def load_columns_from_log(filename: str, depth: Optional[int] = None,
+                          seed: Optional[int] = None,
+                          chunk_size: int = 100000) -> Dict[str, np.ndarray]:
+    """Colunas de um log de run_experiments, lido em blocos"""
+    parts = []
+    chunk = []
+    for record in _iter_log_records(filename, depth, seed):
+        chunk.append((record['config'], record['result'], record['depth']))
+        if len(chunk) >= chunk_size:
+            parts.append(_build_columns(chunk))
+            chunk = []
+    if chunk:
+        parts.append(_build_columns(chunk))
+    return concat_columns(parts)
+
+
+def _as_columns(results) -> Dict[str, np.ndarray]:
+    """Aceita colunas já carregadas ou um dicionário de resultados"""
+    if isinstance(results.get('agent'), np.ndarray):
+        return results
+    return load_columns(results)
+
+
+def group_stats(columns: Dict[str, np.ndarray], value: str,
+                by: Tuple[str, ...] = ('agent',)) -> Dict[tuple, Dict[str, float]]:
+    """Contagem, média e desvio padrão (populacional) de uma coluna agrupada por outras
+    
+    Agrupamento vetorizado (np.unique + np.bincount), em uma única passada.
+    """
+    keys = np.rec.fromarrays([columns[name] for name in by]) if len(by) > 1 else columns[by[0]]
+    labels, inverse = np.unique(keys, return_inverse=True)
+    inverse = inverse.reshape(-1)
+    values = columns[value].astype(np.float64)
+    counts = np.bincount(inverse, minlength=len(labels))
+    means = np.bincount(inverse, weights=values, minlength=len(labels)) / counts
+    squares = np.bincount(inverse, weights=(values - means[inverse]) ** 2, minlength=len(labels))
+    stds = np.sqrt(squares / counts)
+    stats = {}
+    for i, label in enumerate(labels):
+        key = tuple(label.tolist()) if len(by) > 1 else (label.item(),)
+        stats[key] = {'count': int(counts[i]), 'mean': float(means[i]), 'std': float(stds[i])}
+    return stats
+
+
+def win_counts(columns: Dict[str, np.ndarray]) -> Dict[str, int]:
+    """Vitórias por agente e empates (cada partida contada uma vez)"""
+    won = columns['winner'] == columns['side']
+    agents, counts = np.unique(columns['agent'][won], return_counts=True)
+    wins = {str(agent): int(count) for agent, count in zip(agents, counts)}
+    wins['Empate'] = int(np.count_nonzero((columns['winner'] == 'Empate')
+                                          & (columns['side'] == 'X')))
+    return wins
+
+
+def plot_performance_comparison(results: Dict, depth: int, show: bool = True, dpi: int = 300,
+                                filename: str = 'comparacao_minimax_alphabeta.png'):
+    """Gera gráficos comparativos de desempenho (resultados ou colunas de load_columns)"""
     
+    plt = _pyplot(show)
     fig, axes = plt.subplots(2, 2, figsize=(14, 10))
     fig.suptitle(f'Comparação Minimax vs Alpha-Beta (Profundidade {depth})', 
                  fontsize=16, fontweight='bold')
     
-    # Extrair dados
-    configs = list(results.keys())
-    
-    # Dados para Minimax e Alpha-Beta
-    minimax_times = []
-    alphabeta_times = []
-    minimax_nodes = []
-    alphabeta_nodes = []
-    
-    for config, games in results.items():
-        for game in games:
-            if 'minimax_vs' in config:
-                minimax_times.append(game['time_X'])
-                alphabeta_times.append(game['time_O'])
-                minimax_nodes.append(game['nodes_X'])
-                alphabeta_nodes.append(game['nodes_O'])
-            else:
-                alphabeta_times.append(game['time_X'])
-                minimax_times.append(game['time_O'])
-                alphabeta_nodes.append(game['nodes_X'])
-                minimax_nodes.append(game['nodes_O'])
+    # Extrair dados: médias e desvios por agente, de uma vez
+    columns = _as_columns(results)
+    time_stats = group_stats(columns, 'time')
+    node_stats = group_stats(columns, 'nodes')
     
     # Gráfico 1: Tempo de Execução Médio
     ax1 = axes[0, 0]
     agents = ['Minimax', 'Alpha-Beta']
-    avg_times = [np.mean(minimax_times), np.mean(alphabeta_times)]
-    std_times = [np.std(minimax_times), np.std(alphabeta_times)]
+    avg_times = [time_stats[(agent,)]['mean'] for agent in agents]
+    std_times = [time_stats[(agent,)]['std'] for agent in agents]
     
     bars1 = ax1.bar(agents, avg_times, yerr=std_times, capsize=5, 
                     color=['#FF6B6B', '#4ECDC4'], alpha=0.7, edgecolor='black')
@@ -51,8 +177,8 @@ def plot_performance_comparison(results: Dict, depth: int):
     
     # Gráfico 2: Nós Visitados
     ax2 = axes[0, 1]
-    avg_nodes = [np.mean(minimax_nodes), np.mean(alphabeta_nodes)]
-    std_nodes = [np.std(minimax_nodes), np.std(alphabeta_nodes)]
+    avg_nodes = [node_stats[(agent,)]['mean'] for agent in agents]
+    std_nodes = [node_stats[(agent,)]['std'] for agent in agents]
     
     bars2 = ax2.bar(agents, avg_nodes, yerr=std_nodes, capsize=5,
                     color=['#FF6B6B', '#4ECDC4'], alpha=0.7, edgecolor='black')
@@ -66,8 +192,8 @@ def plot_performance_comparison(results: Dict, depth: int):
     
     # Gráfico 3: Eficiência (Speedup e Redução de Nós)
     ax3 = axes[1, 0]
-    speedup = np.mean(minimax_times) / np.mean(alphabeta_times)
-    node_reduction = np.mean(minimax_nodes) / np.mean(alphabeta_nodes)
+    speedup = avg_times[0] / avg_times[1]
+    node_reduction = avg_nodes[0] / avg_nodes[1]
     
     metrics = ['Speedup\n(Tempo)', 'Redução de Nós']
     values = [speedup, node_reduction]
@@ -88,23 +214,8 @@ def plot_performance_comparison(results: Dict, depth: int):
     # Gráfico 4: Distribuição de Vitórias
     ax4 = axes[1, 1]
     
-    wins_summary = {'Minimax': 0, 'Alpha-Beta': 0, 'Empate': 0}
-    
-    for config, games in results.items():
-        for game in games:
-            winner = game['winner']
-            if winner == 'X':
-                if 'minimax_vs' in config:
-                    wins_summary['Minimax'] += 1
-                else:
-                    wins_summary['Alpha-Beta'] += 1
-            elif winner == 'O':
-                if 'minimax_vs' in config:
-                    wins_summary['Alpha-Beta'] += 1
-                else:
-                    wins_summary['Minimax'] += 1
-            else:
-                wins_summary['Empate'] += 1
+    wins = win_counts(columns)
+    wins_summary = {name: wins.get(name, 0) for name in ('Minimax', 'Alpha-Beta', 'Empate')}
     
     labels = list(wins_summary.keys())
     sizes = list(wins_summary.values())
@@ -115,48 +226,31 @@ def plot_performance_comparison(results: Dict, depth: int):
             shadow=True, startangle=90, textprops={'fontweight': 'bold'})
     ax4.set_title('Distribuição de Resultados', fontweight='bold')
     
-    plt.tight_layout()
-    plt.savefig('comparacao_minimax_alphabeta.png', dpi=300, bbox_inches='tight')
-    print("Gráfico salvo: comparacao_minimax_alphabeta.png")
-    plt.show()
+    _finish_figure(plt, fig, filename, show, dpi)
 
 
-def plot_depth_analysis(depths: List[int], results_by_depth: Dict):
-    """Analisa o impacto da profundidade de busca"""
+def plot_depth_analysis(depths: List[int], results_by_depth: Dict, show: bool = True,
+                        dpi: int = 300, filename: str = 'analise_profundidade.png'):
+    """Analisa o impacto da profundidade de busca
+    
+    results_by_depth: {profundidade: resultados} ou colunas já carregadas
+    (load_columns_by_depth / load_columns_from_log).
+    """
     
+    plt = _pyplot(show)
     fig, axes = plt.subplots(1, 2, figsize=(14, 5))
     fig.suptitle('Impacto da Profundidade de Busca', fontsize=16, fontweight='bold')
     
-    minimax_times_by_depth = []
-    alphabeta_times_by_depth = []
-    minimax_nodes_by_depth = []
-    alphabeta_nodes_by_depth = []
+    # Um único agrupamento por (agente, profundidade) para todas as profundidades
+    columns = (results_by_depth if isinstance(results_by_depth.get('agent'), np.ndarray)
+               else load_columns_by_depth({depth: results_by_depth[depth] for depth in depths}))
+    time_stats = group_stats(columns, 'time', by=('agent', 'depth'))
+    node_stats = group_stats(columns, 'nodes', by=('agent', 'depth'))
     
-    for depth in depths:
-        results = results_by_depth[depth]
-        
-        mm_times = []
-        ab_times = []
-        mm_nodes = []
-        ab_nodes = []
-        
-        for config, games in results.items():
-            for game in games:
-                if 'minimax_vs' in config:
-                    mm_times.append(game['time_X'])
-                    ab_times.append(game['time_O'])
-                    mm_nodes.append(game['nodes_X'])
-                    ab_nodes.append(game['nodes_O'])
-                else:
-                    ab_times.append(game['time_X'])
-                    mm_times.append(game['time_O'])
-                    ab_nodes.append(game['nodes_X'])
-                    mm_nodes.append(game['nodes_O'])
-        
-        minimax_times_by_depth.append(np.mean(mm_times))
-        alphabeta_times_by_depth.append(np.mean(ab_times))
-        minimax_nodes_by_depth.append(np.mean(mm_nodes))
-        alphabeta_nodes_by_depth.append(np.mean(ab_nodes))
+    minimax_times_by_depth = [time_stats[('Minimax', depth)]['mean'] for depth in depths]
+    alphabeta_times_by_depth = [time_stats[('Alpha-Beta', depth)]['mean'] for depth in depths]
+    minimax_nodes_by_depth = [node_stats[('Minimax', depth)]['mean'] for depth in depths]
+    alphabeta_nodes_by_depth = [node_stats[('Alpha-Beta', depth)]['mean'] for depth in depths]
     
     # Gráfico 1: Tempo vs Profundidade
     ax1 = axes[0]
@@ -184,14 +278,11 @@ def plot_depth_analysis(depths: List[int], results_by_depth: Dict):
     ax2.grid(True, alpha=0.3)
     ax2.set_xticks(depths)
     
-    plt.tight_layout()
-    plt.savefig('analise_profundidade.png', dpi=300, bbox_inches='tight')
-    print("Gráfico salvo: analise_profundidade.png")
-    plt.show()
+    _finish_figure(plt, fig, filename, show, dpi)
 
 
 def generate_report_table(results: Dict):
-    """Gera tabela formatada para o relatório"""
+    """Gera tabela formatada para o relatório (resultados ou colunas de load_columns)"""
     
     print("\n" + "="*80)
     print("TABELA DE RESULTADOS PARA O RELATÓRIO")
@@ -202,30 +293,18 @@ def generate_report_table(results: Dict):
     print(f"{'Algoritmo':<20} {'Tempo Médio (s)':<20} {'Nós Visitados':<20} {'Desvio Padrão':<20}")
     print("-" * 80)
     
-    minimax_times = []
-    alphabeta_times = []
-    minimax_nodes = []
-    alphabeta_nodes = []
+    columns = _as_columns(results)
+    time_stats = group_stats(columns, 'time')
+    node_stats = group_stats(columns, 'nodes')
+    mm_time, ab_time = time_stats[('Minimax',)], time_stats[('Alpha-Beta',)]
+    mm_nodes, ab_nodes = node_stats[('Minimax',)], node_stats[('Alpha-Beta',)]
     
-    for config, games in results.items():
-        for game in games:
-            if 'minimax_vs' in config:
-                minimax_times.append(game['time_X'])
-                alphabeta_times.append(game['time_O'])
-                minimax_nodes.append(game['nodes_X'])
-                alphabeta_nodes.append(game['nodes_O'])
-            else:
-                alphabeta_times.append(game['time_X'])
-                minimax_times.append(game['time_O'])
-                alphabeta_nodes.append(game['nodes_X'])
-                minimax_nodes.append(game['nodes_O'])
-    
-    print(f"{'Minimax':<20} {np.mean(minimax_times):<20.6f} {np.mean(minimax_nodes):<20.0f} {np.std(minimax_times):<20.6f}")
-    print(f"{'Alpha-Beta':<20} {np.mean(alphabeta_times):<20.6f} {np.mean(alphabeta_nodes):<20.0f} {np.std(alphabeta_times):<20.6f}")
+    print(f"{'Minimax':<20} {mm_time['mean']:<20.6f} {mm_nodes['mean']:<20.0f} {mm_time['std']:<20.6f}")
+    print(f"{'Alpha-Beta':<20} {ab_time['mean']:<20.6f} {ab_nodes['mean']:<20.0f} {ab_time['std']:<20.6f}")
     print("-" * 80)
     
-    speedup = np.mean(minimax_times) / np.mean(alphabeta_times)
-    node_reduction = np.mean(minimax_nodes) / np.mean(alphabeta_nodes)
+    speedup = mm_time['mean'] / ab_time['mean']
+    node_reduction = mm_nodes['mean'] / ab_nodes['mean']
     
     print(f"\nSpeedup (Alpha-Beta): {speedup:.2f}x")
     print(f"Redução de Nós: {node_reduction:.2f}x ({(1-1/node_reduction)*100:.1f}% menos nós)")
@@ -234,25 +313,9 @@ def generate_report_table(results: Dict):
     print("Tabela 2: Resultados das Partidas")
     print("-" * 80)
     
-    wins = {'Minimax': 0, 'Alpha-Beta': 0, 'Empate': 0}
-    total_games = 0
-    
-    for config, games in results.items():
-        for game in games:
-            total_games += 1
-            winner = game['winner']
-            if winner == 'X':
-                if 'minimax_vs' in config:
-                    wins['Minimax'] += 1
-                else:
-                    wins['Alpha-Beta'] += 1
-            elif winner == 'O':
-                if 'minimax_vs' in config:
-                    wins['Alpha-Beta'] += 1
-                else:
-                    wins['Minimax'] += 1
-            else:
-                wins['Empate'] += 1
+    counts = win_counts(columns)
+    wins = {name: counts.get(name, 0) for name in ('Minimax', 'Alpha-Beta', 'Empate')}
+    total_games = len(columns['side']) // 2
     
     print(f"{'Resultado':<20} {'Quantidade':<15} {'Porcentagem':<15}")
     print("-" * 80)
@@ -286,8 +349,181 @@ def save_results_to_json(results: Dict, filename: str = 'resultados_experimento.
     print(f"Resultados salvos em: {filename}")
 
 
+def _iter_log_records(filename: str, depth: Optional[int] = None,
+                      seed: Optional[int] = None) -> Iterator[dict]:
+    """Percorre as linhas do log JSON Lines, uma de cada vez, ignorando linhas truncadas"""
+    with open(filename, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if depth is not None and record['depth'] != depth:
+                continue
+            if seed is not None and record['seed'] != seed:
+                continue
+            yield record
+
+
+def iter_results_log(filename: str, chunk_size: int = 1000, depth: Optional[int] = None,
+                     seed: Optional[int] = None) -> Iterator[List[Tuple[str, Dict]]]:
+    """Lê o log de run_experiments em blocos de até chunk_size pares (configuração, resultado)
+    
+    Só um bloco fica em memória por vez; depth e seed filtram as partidas.
+    """
+    chunk = []
+    for record in _iter_log_records(filename, depth, seed):
+        chunk.append((record['config'], record['result']))
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def iter_move_log(filename: str, depth: Optional[int] = None,
+                  seed: Optional[int] = None) -> Iterator[Dict]:
+    """Registros por jogada do log (gravado com run_experiments(log_moves=True))"""
+    for record in _iter_log_records(filename, depth, seed):
+        for ply, move in enumerate(record.get('move_log', ())):
+            yield dict(move, config=record['config'], index=record['index'], ply=ply)
+
+
+class _RunningStats:
+    """Média e desvio padrão (populacional, como np.std) acumulados pelo método de Welford"""
+    
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+    
+    def add(self, value: float):
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+    
+    @property
+    def std(self) -> float:
+        return (self._m2 / self.count) ** 0.5 if self.count else 0.0
+
+
+def summarize_results_log(filename: str, depth: Optional[int] = None,
+                          seed: Optional[int] = None, chunk_size: int = 1000) -> Dict:
+    """Estatísticas por configuração calculadas em streaming sobre o log
+    
+    Retorna {configuração: {'games', 'wins', 'moves', 'time_X', 'time_O',
+    'nodes_X', 'nodes_O'}}, com média e desvio padrão de cada métrica.
+    """
+    metrics = ('moves', 'time_X', 'time_O', 'nodes_X', 'nodes_O')
+    totals = {}
+    for chunk in iter_results_log(filename, chunk_size, depth, seed):
+        for config, result in chunk:
+            entry = totals.get(config)
+            if entry is None:
+                entry = {'wins': {'X': 0, 'O': 0, 'Empate': 0},
+                         'stats': {metric: _RunningStats() for metric in metrics}}
+                totals[config] = entry
+            entry['wins'][result['winner']] += 1
+            for metric in metrics:
+                entry['stats'][metric].add(result[metric])
+    
+    summary = {}
+    for config, entry in totals.items():
+        summary[config] = {'games': entry['stats']['moves'].count, 'wins': entry['wins']}
+        for metric, stats in entry['stats'].items():
+            summary[config][metric] = {'mean': stats.mean, 'std': stats.std}
+    return summary
+
+
+def print_results_log_summary(summary: Dict):
+    """Imprime o resumo de summarize_results_log"""
+    print("\n" + "="*80)
+    print("RESUMO DO LOG DE RESULTADOS")
+    print("="*80)
+    for config, entry in summary.items():
+        n = entry['games']
+        print(f"\nConfiguração: {config} ({n} partidas)")
+        print("-" * 80)
+        for winner, count in entry['wins'].items():
+            print(f"{winner:<10} {count:<10} {count/n*100:.1f}%")
+        for metric in ('time_X', 'time_O', 'nodes_X', 'nodes_O', 'moves'):
+            print(f"{metric:<10} média {entry[metric]['mean']:<14.6f} "
+                  f"desvio {entry[metric]['std']:.6f}")
+    print("="*80 + "\n")
+
+
+# Funções de gráfico que render_figures pode executar nos processos auxiliares
+FIGURES = {
+    'performance': plot_performance_comparison,
+    'depth': plot_depth_analysis,
+}
+
+
+def _render_figure(name: str, args: tuple, dpi: int):
+    """Gera uma figura sem exibi-la (executável em um processo auxiliar)"""
+    FIGURES[name](*args, show=False, dpi=dpi)
+
+
+def render_figures(jobs: List[Tuple[str, tuple]], workers: int = 1, dpi: int = 300):
+    """Gera figuras sem exibi-las, em paralelo com workers > 1
+    
+    jobs: lista de (nome em FIGURES, argumentos posicionais). Os argumentos
+    são enviados aos processos, então colunas NumPy são preferíveis a
+    dicionários de resultados grandes.
+    """
+    if workers > 1 and len(jobs) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+            futures = [pool.submit(_render_figure, name, args, dpi) for name, args in jobs]
+            for future in futures:
+                future.result()
+    else:
+        for name, args in jobs:
+            _render_figure(name, args, dpi)
+
+
+def generate_report(results: Dict, depth: int, figures: bool = True, workers: int = 1,
+                    dpi: int = 300, json_filename: Optional[str] = None):
+    """Relatório para execução em lote: tabela, JSON opcional e figuras sem exibição
+    
+    Com figures=False o matplotlib nem é importado.
+    """
+    columns = _as_columns(results)
+    generate_report_table(columns)
+    if json_filename is not None:
+        save_results_to_json(results, json_filename)
+    if figures:
+        render_figures([('performance', (columns, depth))], workers, dpi)
+
+
 # Exemplo de uso completo
 if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Análise dos experimentos Minimax vs Alpha-Beta")
+    parser.add_argument('--log', help="gera o relatório a partir de um log de run_experiments, "
+                                      "sem rodar partidas")
+    parser.add_argument('--depth', type=int, help="profundidade filtrada no log")
+    parser.add_argument('--no-figures', action='store_true',
+                        help="só tabelas (o matplotlib não é importado)")
+    parser.add_argument('--workers', type=int, default=1,
+                        help="processos usados para gerar as figuras")
+    parser.add_argument('--dpi', type=int, default=300)
+    args = parser.parse_args()
+    
+    if args.log:
+        columns = load_columns_from_log(args.log, depth=args.depth)
+        generate_report_table(columns)
+        if not args.no_figures:
+            jobs = [('performance', (columns, args.depth or 0))]
+            depths = sorted(set(columns['depth'].tolist()))
+            if len(depths) > 1:
+                jobs.append(('depth', (depths, columns)))
+            render_figures(jobs, args.workers, args.dpi)
+        sys.exit(0)
+    
     # Importar a implementação principal
     from tictactoe_5x5 import run_experiments, MinimaxAgent, AlphaBetaAgent, TicTacToe5x5, simulate_game
     
@@ -300,7 +536,8 @@ if __name__ == "__main__":
     results_depth4 = run_experiments(num_games=10, depth=4)
     
     # Gerar gráficos
-    plot_performance_comparison(results_depth4, depth=4)
+    if not args.no_figures:
+        plot_performance_comparison(results_depth4, depth=4, dpi=args.dpi)
     
     # Gerar tabela
     generate_report_table(results_depth4)
@@ -320,7 +557,8 @@ if __name__ == "__main__":
         print(f"\nTestando profundidade {depth}...")
         results_by_depth[depth] = run_experiments(num_games=5, depth=depth)
     
-    plot_depth_analysis(depths, results_by_depth)
+    if not args.no_figures:
+        plot_depth_analysis(depths, results_by_depth, dpi=args.dpi)
     
     # Análise adicional: Taxa de poda
     print("\n" + "="*80)
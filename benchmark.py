@@ -0,0 +1,222 @@
+"""Benchmark reproduzível dos motores de busca do Jogo da Velha 5x5
+
+Cada variante de agente busca cada posição de um corpus fixo (abertura,
+meio-jogo, tática e final) em cada profundidade de 1 até --depth, com
+rodadas de aquecimento descartadas e várias repetições medidas com
+time.perf_counter_ns. Cada repetição usa um agente novo, então tabelas de
+transposição e históricos não passam de uma medida para outra.
+
+Para cada (variante, posição, profundidade) são registrados os nós (a busca
+é determinística, então a contagem não varia entre repetições), o tempo até
+completar a profundidade e os nós por segundo, com média, mediana, desvio
+padrão, mínimo e máximo. O resultado vai para um arquivo JSON; com
+--compare, os tempos medianos são comparados com os de uma execução anterior.
+
+Uso:
+    python benchmark.py --depth 4 --repetitions 5 --output benchmark.json
+    python benchmark.py --depth 4 --output novo.json --compare benchmark.json
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from tictactoe_5x5 import (TicTacToe5x5, BitboardTicTacToe5x5, MinimaxAgent,
+                           AlphaBetaAgent, PVSAgent, HEURISTIC_TAG)
+
+BENCHMARK_VERSION = 1
+
+# Corpus fixo: nome -> (categoria, jogadas a partir do tabuleiro vazio)
+POSITIONS: Dict[str, Tuple[str, List[Tuple[int, int]]]] = {
+    'vazio': ('abertura', []),
+    'centro': ('abertura', [(2, 2)]),
+    'abertura_3': ('abertura', [(2, 2), (1, 1), (2, 1)]),
+    'meio_8': ('meio-jogo', [(3, 0), (1, 0), (4, 0), (2, 2), (3, 2), (3, 3), (1, 1), (1, 3)]),
+    'tatica_10': ('tática', [(2, 3), (3, 0), (0, 3), (3, 3), (3, 2), (1, 4), (2, 2), (1, 2),
+                             (2, 1), (2, 4)]),
+    'tatica_12': ('tática', [(4, 2), (2, 4), (1, 0), (1, 4), (3, 4), (2, 2), (2, 1), (3, 2),
+                             (1, 2), (2, 3), (4, 1), (1, 1)]),
+    'final_17': ('final', [(2, 0), (1, 1), (4, 0), (1, 0), (1, 3), (3, 1), (2, 1), (2, 3),
+                           (3, 3), (1, 2), (0, 1), (3, 2), (0, 2), (0, 3), (1, 4), (4, 2),
+                           (2, 2)]),
+    'final_18': ('final', [(4, 1), (0, 2), (0, 4), (2, 2), (1, 2), (1, 1), (3, 3), (2, 3),
+                           (2, 1), (0, 3), (0, 0), (3, 2), (4, 0), (4, 2), (2, 4), (1, 4),
+                           (1, 3), (2, 0)]),
+}
+
+_FULL_ORDERING = ('tt', 'killers', 'history', 'center')
+
+# Variantes: nome -> (backend do tabuleiro, fábrica do agente (jogador, profundidade))
+VARIANTS: Dict[str, Tuple[type, Callable]] = {
+    'minimax': (TicTacToe5x5, lambda player, depth: MinimaxAgent(player, depth)),
+    'alphabeta': (TicTacToe5x5, lambda player, depth: AlphaBetaAgent(player, depth)),
+    'alphabeta_bitboard': (BitboardTicTacToe5x5,
+                           lambda player, depth: AlphaBetaAgent(player, depth)),
+    'alphabeta_ordenado': (TicTacToe5x5, lambda player, depth: AlphaBetaAgent(
+        player, depth, tt_size=1 << 16, move_ordering=_FULL_ORDERING)),
+    'alphabeta_simetria': (TicTacToe5x5, lambda player, depth: AlphaBetaAgent(
+        player, depth, tt_size=1 << 16, move_ordering=_FULL_ORDERING, use_symmetry=True)),
+    'pvs': (TicTacToe5x5, lambda player, depth: PVSAgent(
+        player, depth, tt_size=1 << 16, move_ordering=_FULL_ORDERING)),
+    'pvs_ameacas': (TicTacToe5x5, lambda player, depth: PVSAgent(
+        player, depth, tt_size=1 << 16, move_ordering=_FULL_ORDERING, threat_search=6)),
+}
+
+DEFAULT_VARIANTS = ('alphabeta', 'alphabeta_ordenado', 'pvs')
+
+
+def build_position(moves: Sequence[Tuple[int, int]], game_class=TicTacToe5x5) -> TicTacToe5x5:
+    """Reproduz as jogadas a partir do tabuleiro vazio"""
+    game = game_class()
+    for r, c in moves:
+        game.make_move(r, c)
+    return game
+
+
+def summarize(values: Sequence[float]) -> Dict[str, float]:
+    """Média, mediana, desvio padrão, mínimo e máximo"""
+    return {
+        'mean': statistics.fmean(values),
+        'median': statistics.median(values),
+        'stdev': statistics.stdev(values) if len(values) > 1 else 0.0,
+        'min': min(values),
+        'max': max(values),
+    }
+
+
+def measure(variant: str, moves: Sequence[Tuple[int, int]], depth: int,
+            warmup: int, repetitions: int) -> dict:
+    """Mede uma variante em uma posição e profundidade"""
+    game_class, factory = VARIANTS[variant]
+    game = build_position(moves, game_class)
+    times_ms, rates, nodes, chosen = [], [], set(), set()
+    for run in range(warmup + repetitions):
+        agent = factory(game.current_player, depth)
+        start = time.perf_counter_ns()
+        move = agent.get_best_move(game)
+        elapsed = time.perf_counter_ns() - start
+        close = getattr(agent, 'close', None)
+        if close is not None:
+            close()
+        if run < warmup:
+            continue
+        times_ms.append(elapsed / 1e6)
+        rates.append(agent.nodes_visited / (elapsed / 1e9) if elapsed else 0.0)
+        nodes.add(agent.nodes_visited)
+        chosen.add(move)
+    return {
+        'nodes': sorted(nodes)[0] if len(nodes) == 1 else sorted(nodes),
+        'move': list(sorted(chosen)[0]) if len(chosen) == 1 else [list(m) for m in sorted(chosen)],
+        'time_ms': summarize(times_ms),
+        'nodes_per_sec': summarize(rates),
+    }
+
+
+def _git_revision() -> Optional[str]:
+    """Commit atual do repositório, se disponível"""
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmark(variants: Sequence[str] = DEFAULT_VARIANTS, max_depth: int = 3,
+                  positions: Optional[Sequence[str]] = None, warmup: int = 1,
+                  repetitions: int = 5, verbose: bool = True) -> dict:
+    """Executa o benchmark e retorna o relatório (serializável em JSON)"""
+    for variant in variants:
+        if variant not in VARIANTS:
+            raise ValueError(f"Variante desconhecida: {variant}")
+    if positions is None:
+        positions = list(POSITIONS)
+    for name in positions:
+        if name not in POSITIONS:
+            raise ValueError(f"Posição desconhecida: {name}")
+
+    results = []
+    for variant in variants:
+        for name in positions:
+            category, moves = POSITIONS[name]
+            for depth in range(1, max_depth + 1):
+                entry = measure(variant, moves, depth, warmup, repetitions)
+                entry.update({'variant': variant, 'position': name,
+                              'category': category, 'depth': depth})
+                results.append(entry)
+                if verbose:
+                    print(f"{variant:20s} {name:12s} d={depth}  "
+                          f"{entry['time_ms']['median']:9.2f} ms  "
+                          f"{entry['nodes_per_sec']['median']:10.0f} nós/s  "
+                          f"nós={entry['nodes']}")
+
+    return {
+        'version': BENCHMARK_VERSION,
+        'heuristic': HEURISTIC_TAG,
+        'revision': _git_revision(),
+        'python': sys.version.split()[0],
+        'platform': platform.platform(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'warmup': warmup,
+        'repetitions': repetitions,
+        'results': results,
+    }
+
+
+def compare_reports(baseline: dict, current: dict, threshold: float = 0.1) -> List[dict]:
+    """Compara tempos medianos e nós com um relatório anterior
+
+    Retorna uma linha por medida presente nos dois relatórios; regressões são
+    tempos mais de threshold (fração) acima da referência.
+    """
+    reference = {(r['variant'], r['position'], r['depth']): r for r in baseline['results']}
+    rows = []
+    for entry in current['results']:
+        old = reference.get((entry['variant'], entry['position'], entry['depth']))
+        if old is None:
+            continue
+        ratio = entry['time_ms']['median'] / old['time_ms']['median']
+        rows.append({'variant': entry['variant'], 'position': entry['position'],
+                     'depth': entry['depth'], 'time_ratio': ratio,
+                     'nodes_before': old['nodes'], 'nodes_after': entry['nodes'],
+                     'regression': ratio > 1 + threshold})
+    return rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark dos agentes do Jogo da Velha 5x5")
+    parser.add_argument('--variants', nargs='+', default=list(DEFAULT_VARIANTS),
+                        choices=list(VARIANTS))
+    parser.add_argument('--positions', nargs='+', choices=list(POSITIONS),
+                        help="posições do corpus (padrão: todas)")
+    parser.add_argument('--depth', type=int, default=3,
+                        help="profundidade máxima (mede de 1 até ela)")
+    parser.add_argument('--warmup', type=int, default=1)
+    parser.add_argument('--repetitions', type=int, default=5)
+    parser.add_argument('--output', default='benchmark.json')
+    parser.add_argument('--compare', help="relatório anterior para comparação")
+    parser.add_argument('--threshold', type=float, default=0.1,
+                        help="fração de aumento do tempo mediano tratada como regressão")
+    args = parser.parse_args()
+
+    report = run_benchmark(args.variants, args.depth, args.positions,
+                           args.warmup, args.repetitions)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(f"Relatório salvo em {args.output}")
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        rows = compare_reports(baseline, report, args.threshold)
+        for row in rows:
+            flag = "  REGRESSÃO" if row['regression'] else ""
+            print(f"{row['variant']:20s} {row['position']:12s} d={row['depth']}  "
+                  f"tempo x{row['time_ratio']:.2f}  "
+                  f"nós {row['nodes_before']} -> {row['nodes_after']}{flag}")
+        if any(row['regression'] for row in rows):
+            sys.exit(1)
@@ -0,0 +1,236 @@
+"""Tabela de finais (tablebase) para o Jogo da Velha 5x5
+
+Resolve exatamente posições com até K casas vazias: para o jogador da vez,
+vitória, empate ou derrota e a distância (em jogadas) até o fim com jogo
+perfeito. Enumerar todas as posições com K casas vazias é inviável no 5x5
+(já com uma casa vazia são dezenas de milhões), então a tabela é preenchida
+sob demanda: cada final consultado é resolvido por busca exaustiva com
+memorização, e todas as posições canônicas resolvidas podem ser gravadas em
+disco e recarregadas.
+
+Formato do arquivo (little-endian): mágica (8 bytes), versão (uint16), K
+(uint16), número de posições (uint32); chaves canônicas ordenadas (uint64,
+ver canonical_form); resultados empacotados em 2 bits (0 = derrota,
+1 = empate, 2 = vitória, 4 por byte); distâncias (uint8).
+
+Uso:
+    python endgame_tablebase.py --max-empty 8 --games 50 --output finais.bin
+"""
+
+import argparse
+import random
+import struct
+import time
+from array import array
+from bisect import bisect_left
+from typing import Dict, Optional, Tuple
+
+from tictactoe_5x5 import (TicTacToe5x5, AlphaBetaAgent, DEFAULT_GEOMETRY, canonical_form,
+                           _SearchTimeout)
+
+TABLEBASE_MAGIC = b'TTT5TBAS'
+TABLEBASE_VERSION = 1
+_HEADER = struct.Struct('<8sHHI')
+
+LOSS, DRAW, WIN = 0, 1, 2
+
+# Pontuação interna: vitória em d jogadas vale _MATE - d, derrota -( _MATE - d)
+_MATE = 100
+
+# Posições não resolvidas visitadas entre verificações do prazo (ver deadline em value)
+_TIME_CHECK_INTERVAL = 16
+
+
+class EndgameTablebase:
+    """Resultados exatos de posições com até max_empty casas vazias"""
+
+    def __init__(self, max_empty: int = 8):
+        self.max_empty = max_empty
+        self._solved: Dict[int, int] = {}
+        # Tabela carregada do disco: chaves ordenadas + resultados empacotados
+        self._keys = array('Q')
+        self._packed = bytearray()
+        self._distances = bytearray()
+        self.positions_solved = 0
+        self._solve_calls = 0
+
+    def __len__(self) -> int:
+        return len(self._solved) + len(self._keys)
+
+    def covers(self, game: TicTacToe5x5) -> bool:
+        """Indica se a posição tem poucas casas vazias o bastante para a tabela
+        
+        A tabela é do 5x5 com 4 em linha; outros tabuleiros nunca são cobertos.
+        """
+        return game.geometry is DEFAULT_GEOMETRY and 25 - game.move_count <= self.max_empty
+
+    def probe(self, game: TicTacToe5x5) -> Tuple[int, int]:
+        """Resultado (WIN/DRAW/LOSS para o jogador da vez, distância até o fim)"""
+        score = self._score(game)
+        if score > 0:
+            return WIN, _MATE - score
+        if score < 0:
+            return LOSS, _MATE + score
+        return DRAW, 25 - game.move_count
+
+    def value(self, game: TicTacToe5x5, player: str, deadline: Optional[float] = None) -> int:
+        """Resultado exato do ponto de vista do jogador: 1, 0 ou -1
+        
+        Com deadline (time.perf_counter), uma resolução que passe do prazo é
+        interrompida com _SearchTimeout, deixando o jogo com jogadas feitas (use
+        uma cópia); as posições já resolvidas continuam na tabela.
+        """
+        return self._result(game, player, self._score(game, deadline))
+
+    def known_value(self, game: TicTacToe5x5, player: str) -> Optional[int]:
+        """Como value, mas sem resolver: None se a posição ainda não foi resolvida"""
+        if game.winner is not None or game.move_count == 25:
+            return self.value(game, player)
+        score = self._lookup(canonical_form(game)[0])
+        return None if score is None else self._result(game, player, score)
+
+    @staticmethod
+    def _result(game: TicTacToe5x5, player: str, score: int) -> int:
+        """Converte a pontuação do jogador da vez em 1, 0 ou -1 para o jogador"""
+        if game.current_player != player:
+            score = -score
+        return (score > 0) - (score < 0)
+
+    def best_move(self, game: TicTacToe5x5, deadline: Optional[float] = None) -> Tuple[int, int]:
+        """Jogada perfeita: vence o mais rápido possível ou perde o mais tarde possível
+        
+        deadline como em value.
+        """
+        best_score, best_move = None, None
+        for move in game.get_available_moves():
+            game.make_move(move[0], move[1])
+            score = -self._score(game, deadline)
+            game.undo_move()
+            if best_score is None or score > best_score:
+                best_score, best_move = score, move
+        return best_move
+
+    def _lookup(self, key: int) -> Optional[int]:
+        """Pontuação de uma posição já resolvida (memória ou arquivo)"""
+        score = self._solved.get(key)
+        if score is not None:
+            return score
+        index = bisect_left(self._keys, key)
+        if index < len(self._keys) and self._keys[index] == key:
+            wdl = (self._packed[index >> 2] >> ((index & 3) * 2)) & 3
+            distance = self._distances[index]
+            if wdl == WIN:
+                return _MATE - distance
+            if wdl == LOSS:
+                return -(_MATE - distance)
+            return 0
+        return None
+
+    def _score(self, game: TicTacToe5x5, deadline: Optional[float] = None) -> int:
+        """Pontuação exata para o jogador da vez, resolvendo a posição se preciso"""
+        if game.winner is not None:
+            return -_MATE  # o jogador anterior acabou de vencer
+        if game.move_count == 25:
+            return 0
+
+        key, _ = canonical_form(game)
+        score = self._lookup(key)
+        if score is not None:
+            return score
+        self._solve_calls += 1
+        if (deadline is not None and self._solve_calls % _TIME_CHECK_INTERVAL == 0
+                and time.perf_counter() >= deadline):
+            raise _SearchTimeout()
+
+        best = -_MATE
+        for move in game.get_available_moves():
+            game.make_move(move[0], move[1])
+            child = -self._score(game, deadline)
+            game.undo_move()
+            # Cada jogada afasta o fim da partida em um lance
+            if child > 0:
+                child -= 1
+            elif child < 0:
+                child += 1
+            if child > best:
+                best = child
+        self._solved[key] = best
+        self.positions_solved += 1
+        return best
+
+    def save(self, path: str):
+        """Grava todas as posições resolvidas no formato compacto"""
+        entries = {key: self._lookup(key) for key in self._keys}
+        entries.update(self._solved)
+        keys = sorted(entries)
+        packed = bytearray((len(keys) + 3) // 4)
+        distances = bytearray(len(keys))
+        for index, key in enumerate(keys):
+            score = entries[key]
+            if score > 0:
+                wdl, distance = WIN, _MATE - score
+            elif score < 0:
+                wdl, distance = LOSS, _MATE + score
+            else:
+                wdl, distance = DRAW, 0
+            packed[index >> 2] |= wdl << ((index & 3) * 2)
+            distances[index] = distance
+        with open(path, 'wb') as f:
+            f.write(_HEADER.pack(TABLEBASE_MAGIC, TABLEBASE_VERSION, self.max_empty, len(keys)))
+            array('Q', keys).tofile(f)
+            f.write(packed)
+            f.write(distances)
+
+    @classmethod
+    def load(cls, path: str) -> 'EndgameTablebase':
+        """Carrega uma tabela gravada com save()"""
+        with open(path, 'rb') as f:
+            raw = f.read(_HEADER.size)
+            if len(raw) < _HEADER.size:
+                raise ValueError(f"Tabela de finais inválida: {path}")
+            magic, version, max_empty, count = _HEADER.unpack(raw)
+            if magic != TABLEBASE_MAGIC or version != TABLEBASE_VERSION:
+                raise ValueError(f"Tabela de finais inválida: {path}")
+            tablebase = cls(max_empty)
+            tablebase._keys.fromfile(f, count)
+            tablebase._packed = bytearray(f.read((count + 3) // 4))
+            tablebase._distances = bytearray(f.read(count))
+        return tablebase
+
+
+def populate_from_games(tablebase: EndgameTablebase, num_games: int, depth: int = 3,
+                        seed: int = 0, verbose: bool = True):
+    """Resolve os finais alcançados em partidas Alfa-Beta com aberturas aleatórias"""
+    rng = random.Random(seed)
+    start = time.time()
+    for i in range(num_games):
+        game = TicTacToe5x5()
+        agents = {'X': AlphaBetaAgent('X', depth), 'O': AlphaBetaAgent('O', depth)}
+        for _ in range(4):
+            game.make_move(*rng.choice(game.get_available_moves()))
+        while not game.is_terminal():
+            if tablebase.covers(game):
+                tablebase.probe(game)
+                break
+            game.make_move(*agents[game.current_player].get_best_move(game))
+        if verbose:
+            print(f"Partida {i + 1}: {len(tablebase)} posições na tabela "
+                  f"({time.time() - start:.1f}s)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Gera a tabela de finais do Jogo da Velha 5x5")
+    parser.add_argument('--max-empty', type=int, default=8,
+                        help="número máximo de casas vazias resolvidas")
+    parser.add_argument('--games', type=int, default=50,
+                        help="partidas usadas para alcançar posições de final")
+    parser.add_argument('--depth', type=int, default=3,
+                        help="profundidade dos agentes que jogam as partidas")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', default='finais.bin')
+    args = parser.parse_args()
+
+    tablebase = EndgameTablebase(args.max_empty)
+    populate_from_games(tablebase, args.games, args.depth, args.seed)
+    tablebase.save(args.output)
+    print(f"Tabela salva em {args.output}: {len(tablebase)} posições")
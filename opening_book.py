@@ -0,0 +1,204 @@
+"""Livro de aberturas para o Jogo da Velha 5x5
+
+Gera offline, com Alfa-Beta profundo, a melhor jogada de todas as posições
+canônicas (a menos de simetria) até N jogadas e grava o resultado em um
+arquivo binário compacto. Os agentes consultam o livro via mmap, sob demanda.
+
+Formato do arquivo (little-endian):
+- cabeçalho: mágica (8 bytes), versão (uint16), profundidade da busca (uint16),
+  número de jogadas coberto (uint16), número de registros (uint32) e
+  identificador da heurística (32 bytes, UTF-8)
+- registros ordenados pela chave: chave canônica (uint64, ver canonical_form),
+  casa da jogada no referencial canônico (uint8, linha*5 + coluna) e valor
+  da posição para o jogador da vez (int32)
+
+Uso:
+    python opening_book.py --plies 4 --depth 6 --output livro_aberturas.bin
+"""
+
+import argparse
+import mmap
+import struct
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from tictactoe_5x5 import (TicTacToe5x5, AlphaBetaAgent, HEURISTIC_TAG, DEFAULT_GEOMETRY,
+                           INVERSE_SYMMETRY, canonical_form, transform_move)
+
+BOOK_MAGIC = b'TTT5BOOK'
+BOOK_VERSION = 1
+_HEADER = struct.Struct('<8sHHHI32s')
+_RECORD = struct.Struct('<QBi')
+
+
+class OpeningBook:
+    """Livro de aberturas somente leitura, aberto sob demanda e mapeado em memória
+
+    O cabeçalho é validado na abertura: arquivos de outra versão ou gerados com
+    outra heurística levantam ValueError.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = None
+        self._data = None
+        self.depth = 0
+        self.plies = 0
+        self.count = 0
+        self._read_header()
+
+    def _read_header(self):
+        """Lê e valida o cabeçalho"""
+        with open(self.path, 'rb') as f:
+            raw = f.read(_HEADER.size)
+        if len(raw) < _HEADER.size:
+            raise ValueError(f"Livro de aberturas inválido: {self.path}")
+        magic, version, depth, plies, count, tag = _HEADER.unpack(raw)
+        if magic != BOOK_MAGIC or version != BOOK_VERSION:
+            raise ValueError(f"Livro de aberturas inválido: {self.path}")
+        tag = tag.rstrip(b'\0').decode('utf-8')
+        if tag != HEURISTIC_TAG:
+            raise ValueError(f"Livro de aberturas gerado com outra heurística "
+                             f"({tag}, esperado {HEURISTIC_TAG}): {self.path}")
+        self.depth, self.plies, self.count = depth, plies, count
+
+    def _open(self):
+        """Mapeia o arquivo em memória na primeira consulta"""
+        self._file = open(self.path, 'rb')
+        self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def _find(self, key: int) -> Optional[Tuple[int, int]]:
+        """Busca binária pela chave; retorna (casa, valor) ou None"""
+        if self._data is None:
+            self._open()
+        data = self._data
+        lo, hi = 0, self.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            mid_key, cell, value = _RECORD.unpack_from(data, _HEADER.size + mid * _RECORD.size)
+            if mid_key < key:
+                lo = mid + 1
+            elif mid_key > key:
+                hi = mid
+            else:
+                return cell, value
+        return None
+
+    def lookup(self, game: TicTacToe5x5) -> Optional[Tuple[Tuple[int, int], int]]:
+        """Jogada e valor (para o jogador da vez) da posição, se estiver no livro
+        
+        O livro é do 5x5 com 4 em linha; outros tabuleiros nunca estão no livro.
+        """
+        if (game.geometry is not DEFAULT_GEOMETRY or len(game.move_history) > self.plies
+                or game.is_terminal()):
+            return None
+        key, symmetry = canonical_form(game)
+        found = self._find(key)
+        if found is None:
+            return None
+        cell, value = found
+        move = transform_move(divmod(cell, 5), INVERSE_SYMMETRY[symmetry])
+        if game.board[move[0]][move[1]] != ' ':
+            return None
+        return move, value
+
+    def close(self):
+        """Libera o mapeamento do arquivo"""
+        if self._data is not None:
+            self._data.close()
+            self._file.close()
+            self._data = None
+            self._file = None
+
+    def __getstate__(self):
+        # O mapeamento não é serializável; cada processo reabre o arquivo
+        state = self.__dict__.copy()
+        state['_file'] = None
+        state['_data'] = None
+        return state
+
+
+def enumerate_canonical_positions(plies: int) -> List[List[Tuple[int, int]]]:
+    """Sequências de jogadas que levam a cada posição canônica não terminal até N jogadas"""
+    positions = []
+    seen = set()
+    frontier = [[]]
+    for ply in range(plies + 1):
+        next_frontier = []
+        for moves in frontier:
+            game = TicTacToe5x5()
+            for r, c in moves:
+                game.make_move(r, c)
+            key, _ = canonical_form(game)
+            if key in seen or game.is_terminal():
+                continue
+            seen.add(key)
+            positions.append(moves)
+            if ply < plies:
+                next_frontier.extend(moves + [move] for move in game.get_available_moves())
+        frontier = next_frontier
+    return positions
+
+
+def _analyze_position(moves: List[Tuple[int, int]], depth: int) -> Tuple[int, int, int]:
+    """Busca uma posição e retorna (chave canônica, casa canônica, valor)"""
+    game = TicTacToe5x5()
+    for r, c in moves:
+        game.make_move(r, c)
+    agent = AlphaBetaAgent(game.current_player, depth, tt_size=1 << 18, use_symmetry=True,
+                           move_ordering=('tt', 'killers', 'history', 'center'))
+    move = agent.get_best_move(game)
+    key, symmetry = canonical_form(game)
+    row, col = transform_move(move, symmetry)
+    return key, row * 5 + col, int(agent.best_value)
+
+
+def build_opening_book(path: str, plies: int, depth: int, workers: int = 1,
+                       verbose: bool = True) -> int:
+    """Gera o livro de aberturas e retorna o número de posições gravadas"""
+    positions = enumerate_canonical_positions(plies)
+    if verbose:
+        print(f"{len(positions)} posições canônicas até {plies} jogadas "
+              f"(profundidade {depth})")
+
+    start = time.time()
+    records: Dict[int, Tuple[int, int]] = {}
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = pool.map(_analyze_position, positions, [depth] * len(positions),
+                               chunksize=8)
+            for key, cell, value in results:
+                records[key] = (cell, value)
+    else:
+        for i, moves in enumerate(positions):
+            key, cell, value = _analyze_position(moves, depth)
+            records[key] = (cell, value)
+            if verbose and (i + 1) % 100 == 0:
+                print(f"  {i + 1}/{len(positions)} posições ({time.time() - start:.1f}s)")
+
+    with open(path, 'wb') as f:
+        f.write(_HEADER.pack(BOOK_MAGIC, BOOK_VERSION, depth, plies, len(records),
+                             HEURISTIC_TAG.encode('utf-8')))
+        for key in sorted(records):
+            cell, value = records[key]
+            f.write(_RECORD.pack(key, cell, value))
+
+    if verbose:
+        print(f"Livro salvo em {path}: {len(records)} posições "
+              f"em {time.time() - start:.1f}s")
+    return len(records)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Gera o livro de aberturas do Jogo da Velha 5x5")
+    parser.add_argument('--plies', type=int, default=3,
+                        help="número de jogadas cobertas pelo livro")
+    parser.add_argument('--depth', type=int, default=6,
+                        help="profundidade da busca Alfa-Beta de cada posição")
+    parser.add_argument('--workers', type=int, default=1,
+                        help="processos usados na geração")
+    parser.add_argument('--output', default='livro_aberturas.bin')
+    args = parser.parse_args()
+
+    build_opening_book(args.output, args.plies, args.depth, args.workers)
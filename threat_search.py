@@ -0,0 +1,131 @@
+"""Busca no espaço de ameaças (threat-space search) para o Jogo da Velha 5x5
+
+Uma ameaça é uma janela com 3 peças de um jogador e a quarta casa vazia (em
+tabuleiros N x N com K em linha, K-1 peças e a última casa vazia). A
+busca considera só jogadas do atacante que criam ameaças e as defesas
+forçadas do oponente (bloquear a casa ameaçada), o que prova ou refuta
+vitórias forçadas em uma fração dos nós de uma busca completa.
+
+A prova é correta: quando o atacante cria uma única ameaça o defensor é
+obrigado a bloqueá-la (qualquer outra jogada perde em seguida, a menos que o
+próprio defensor vença na hora, caso verificado); com duas ou mais ameaças
+em casas diferentes, ou com uma vitória imediata, o atacante vence. Uma
+refutação só significa que não há vitória por ameaças dentro do limite.
+
+Uso:
+    from threat_search import find_forced_win
+    move = find_forced_win(game, max_threats=6)
+"""
+
+from typing import Dict, List, Optional, Set, Tuple
+
+from tictactoe_5x5 import TicTacToe5x5
+
+
+def winning_cells(game: TicTacToe5x5, player: str) -> Set[Tuple[int, int]]:
+    """Casas vazias que completam uma janela do jogador"""
+    own, other = ((game.x_counts, game.o_counts) if player == 'X'
+                  else (game.o_counts, game.x_counts))
+    board = game.board
+    threat = game.geometry.k - 1
+    cells = set()
+    for w, line in enumerate(game.geometry.win_lines):
+        if own[w] == threat and other[w] == 0:
+            for r, c in line:
+                if board[r][c] == ' ':
+                    cells.add((r, c))
+                    break
+    return cells
+
+
+def threat_moves(game: TicTacToe5x5, player: str) -> List[Tuple[int, int]]:
+    """Jogadas que criam ao menos uma ameaça, mais frequentes primeiro"""
+    own, other = ((game.x_counts, game.o_counts) if player == 'X'
+                  else (game.o_counts, game.x_counts))
+    board = game.board
+    builder = game.geometry.k - 2
+    counts: Dict[Tuple[int, int], int] = {}
+    for w, line in enumerate(game.geometry.win_lines):
+        if own[w] == builder and other[w] == 0:
+            for r, c in line:
+                if board[r][c] == ' ':
+                    counts[(r, c)] = counts.get((r, c), 0) + 1
+    return sorted(counts, key=lambda move: -counts[move])
+
+
+class ThreatSearch:
+    """Prova vitórias forçadas do jogador da vez usando só ameaças
+
+    max_threats limita o número de jogadas do atacante na sequência.
+    nodes_visited conta as posições examinadas na última chamada.
+    """
+
+    def __init__(self, max_threats: int = 6):
+        self.max_threats = max_threats
+        self.nodes_visited = 0
+        self._refuted: Dict[int, int] = {}
+
+    def find_forced_win(self, game: TicTacToe5x5) -> Optional[Tuple[int, int]]:
+        """Primeira jogada de uma vitória forçada por ameaças, ou None"""
+        self.nodes_visited = 0
+        self._refuted = {}
+        if game.is_terminal():
+            return None
+        return self._attack(game, game.current_player, self.max_threats)
+
+    def _attack(self, game: TicTacToe5x5, attacker: str,
+                threats_left: int) -> Optional[Tuple[int, int]]:
+        """Jogada do atacante que vence ou força a vitória, ou None"""
+        self.nodes_visited += 1
+        wins = winning_cells(game, attacker)
+        if wins:
+            return min(wins)
+        if threats_left == 0 or game.move_count >= game.geometry.cells - 1:
+            return None
+        # Posições já refutadas com pelo menos esse orçamento
+        if self._refuted.get(game.zobrist_hash, -1) >= threats_left:
+            return None
+
+        defender = 'O' if attacker == 'X' else 'X'
+        must_block = winning_cells(game, defender)
+        if len(must_block) > 1:
+            self._refuted[game.zobrist_hash] = threats_left
+            return None
+
+        candidates = threat_moves(game, attacker)
+        if must_block:
+            # O atacante precisa bloquear; só segue se o bloqueio também ameaça
+            block = next(iter(must_block))
+            candidates = [block] if block in candidates else []
+
+        for move in candidates:
+            game.make_move(move[0], move[1])
+            won = self._defend(game, attacker, threats_left - 1)
+            game.undo_move()
+            if won:
+                return move
+        self._refuted[game.zobrist_hash] = threats_left
+        return None
+
+    def _defend(self, game: TicTacToe5x5, attacker: str, threats_left: int) -> bool:
+        """Indica se o atacante vence contra todas as defesas relevantes"""
+        self.nodes_visited += 1
+        defender = game.current_player
+        if winning_cells(game, defender):
+            return False  # o defensor vence antes
+        threats = winning_cells(game, attacker)
+        if len(threats) > 1:
+            return True  # não dá para bloquear duas casas
+        if game.move_count == game.geometry.cells:
+            return False
+        # Uma única ameaça: qualquer jogada que não a bloqueie perde em seguida
+        block = next(iter(threats))
+        game.make_move(block[0], block[1])
+        won = game.winner is None and self._attack(game, attacker, threats_left) is not None
+        game.undo_move()
+        return won
+
+
+def find_forced_win(game: TicTacToe5x5, max_threats: int = 6) -> Optional[Tuple[int, int]]:
+    """Atalho para ThreatSearch(max_threats).find_forced_win(game)"""
+    return ThreatSearch(max_threats).find_forced_win(game)
@@ -1,29 +1,233 @@
+import math
 import time
 import random
-from typing import List, Tuple, Optional
-from collections import defaultdict
+from typing import Dict, List, Tuple, Optional
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import json
+import zlib
+
+
+WIN_SCORE = 1000
+
+# Semente fixa das chaves Zobrist, para que a mesma posição tenha a mesma chave
+# em qualquer processo (combinada com size e k fora do 5x5 com 4 em linha)
+_ZOBRIST_SEED = 0x5A0B1157
+_HASH_MASK = (1 << 64) - 1
+
+
+def _build_win_lines(size: int = 5, k: int = 4) -> List[Tuple[Tuple[int, int], ...]]:
+    """Gera as janelas de k casas consecutivas do tabuleiro size x size (28 no 5x5 com k=4)"""
+    lines = []
+    for i in range(size):
+        for j in range(size):
+            # Horizontal, vertical, diagonal descendente e diagonal ascendente
+            for dr, dc in ((0, 1), (1, 0), (1, 1), (-1, 1)):
+                end_r, end_c = i + (k - 1)*dr, j + (k - 1)*dc
+                if 0 <= end_r < size and 0 <= end_c < size:
+                    lines.append(tuple((i + n*dr, j + n*dc) for n in range(k)))
+    return lines
+
+
+def window_value(player_count: int, opponent_count: int, k: int = 4) -> int:
+    """Pontuação heurística de uma janela de k casas do ponto de vista do jogador"""
+    # Se ambos os jogadores têm peças, a sequência é inútil
+    if player_count > 0 and opponent_count > 0:
+        return 0
+    
+    # Pontuação baseada no número de peças; a escala é ajustada para que k-1
+    # peças valham 1000 para qualquer k (com k=4, exatamente 10**peças)
+    if player_count > 0:
+        return round(10 ** (3 * player_count / (k - 1))) if k > 1 else 1
+    elif opponent_count > 0:
+        return -round(10 ** (3 * opponent_count / (k - 1))) if k > 1 else -1
+    
+    return 0
+
+
+def _build_symmetries(size: int = 5) -> List[List[List[Tuple[int, int]]]]:
+    """As 8 simetrias do quadrado (grupo D4) como mapas casa -> casa"""
+    n = size - 1
+    transforms = [
+        lambda r, c: (r, c),          # identidade
+        lambda r, c: (c, n - r),      # rotação de 90°
+        lambda r, c: (n - r, n - c),  # rotação de 180°
+        lambda r, c: (n - c, r),      # rotação de 270°
+        lambda r, c: (r, n - c),      # reflexão horizontal
+        lambda r, c: (n - r, c),      # reflexão vertical
+        lambda r, c: (c, r),          # reflexão na diagonal principal
+        lambda r, c: (n - c, n - r),  # reflexão na diagonal secundária
+    ]
+    return [[[t(r, c) for c in range(size)] for r in range(size)] for t in transforms]
+
+
+class BoardGeometry:
+    """Tabelas pré-calculadas de um tabuleiro size x size com vitória por k em linha
+
+    Não instancie diretamente: board_geometry(size, k) gera as tabelas uma vez
+    por (size, k) e as reutiliza, de modo que todos os tabuleiros e agentes com
+    as mesmas dimensões compartilham a mesma instância.
+    """
+
+    __slots__ = ('size', 'k', 'cells', 'full_mask', 'win_lines', 'win_masks', 'cell_lines',
+                 'x_gain', 'o_gain', 'center_rank', 'zobrist_keys', 'empty_key', 'symmetries',
+                 'symmetry_keys', 'empty_symmetry_keys')
+
+    def __init__(self, size: int, k: int):
+        self.size = size
+        self.k = k
+        self.cells = size * size
+        self.full_mask = (1 << self.cells) - 1
+
+        # Janelas de vitória como tuplas de casas e como máscaras de bits
+        # (a casa (linha, coluna) corresponde ao bit linha*size + coluna)
+        self.win_lines = _build_win_lines(size, k)
+        self.win_masks = [sum(1 << (r * size + c) for r, c in line) for line in self.win_lines]
+
+        # Índices das janelas que passam por cada casa
+        self.cell_lines = [[[] for _ in range(size)] for _ in range(size)]
+        for w, line in enumerate(self.win_lines):
+            for r, c in line:
+                self.cell_lines[r][c].append(w)
+
+        # Variação da pontuação (do ponto de vista de X) ao colocar uma peça de X
+        # ou de O numa janela com (peças de X, peças de O)
+        values = [[window_value(x, o, k) for o in range(k + 1)] for x in range(k + 1)]
+        self.x_gain = [[values[x + 1][o] - values[x][o] if x < k else 0
+                        for o in range(k + 1)] for x in range(k + 1)]
+        self.o_gain = [[values[x][o + 1] - values[x][o] if o < k else 0
+                        for o in range(k + 1)] for x in range(k + 1)]
+
+        # Ordem estática "centro primeiro": anel em torno do centro e, dentro do
+        # anel, distância de Manhattan (menor valor = jogada testada antes). As
+        # distâncias são dobradas para que o centro de tabuleiros pares, que fica
+        # entre casas, também dê valores inteiros.
+        n = size - 1
+        self.center_rank = [[max(abs(2*r - n), abs(2*c - n)) * 10 + abs(2*r - n) + abs(2*c - n)
+                             for c in range(size)] for r in range(size)]
+
+        # Chaves Zobrist de 64 bits por (jogador, casa) e chave do tabuleiro vazio.
+        # Cada (size, k) tem chaves próprias, inclusive para o tabuleiro vazio,
+        # para que caches e tabelas compartilhados entre dimensões não confundam
+        # posições; o 5x5 com 4 em linha mantém a semente original e a chave 0.
+        default = (size, k) == (5, 4)
+        rng = random.Random(_ZOBRIST_SEED if default else f"{_ZOBRIST_SEED:x}:{size}:{k}")
+        self.zobrist_keys = {player: [[rng.getrandbits(64) for _ in range(size)]
+                                      for _ in range(size)]
+                             for player in ('X', 'O')}
+        self.empty_key = 0 if default else rng.getrandbits(64)
+
+        # symmetries[s][r][c] é a casa para onde a simetria s leva (r, c)
+        self.symmetries = _build_symmetries(size)
+
+        # As 8 chaves Zobrist de cada (jogador, casa) sob cada simetria, empacotadas
+        # em um único inteiro de 8*64 bits: um XOR por jogada atualiza as 8 chaves
+        keys, symmetries = self.zobrist_keys, self.symmetries
+        self.symmetry_keys = {player: [[sum(keys[player][symmetries[s][r][c][0]][symmetries[s][r][c][1]]
+                                            << (64 * s) for s in range(8))
+                                        for c in range(size)] for r in range(size)]
+                              for player in ('X', 'O')}
+        # O tabuleiro vazio é simétrico: a mesma chave nas 8 posições
+        self.empty_symmetry_keys = sum(self.empty_key << (64 * s) for s in range(8))
+
+
+_GEOMETRIES: Dict[Tuple[int, int], BoardGeometry] = {}
+
+
+def board_geometry(size: int = 5, k: int = 4) -> BoardGeometry:
+    """Tabelas do tabuleiro size x size com vitória por k em linha (geradas uma vez e reutilizadas)"""
+    geometry = _GEOMETRIES.get((size, k))
+    if geometry is None:
+        if not 1 <= k <= size:
+            raise ValueError(f"k deve estar entre 1 e o tamanho do tabuleiro: {size}x{size}, k={k}")
+        geometry = _GEOMETRIES[(size, k)] = BoardGeometry(size, k)
+    return geometry
+
+
+# Tabuleiro padrão 5x5 com 4 em linha. As tabelas abaixo são as da geometria
+# padrão, mantidas no nível do módulo para os módulos específicos do 5x5
+# (livro de aberturas, tabela de finais, avaliação vetorizada).
+DEFAULT_GEOMETRY = board_geometry(5, 4)
+WIN_LINES = DEFAULT_GEOMETRY.win_lines
+WIN_MASKS = DEFAULT_GEOMETRY.win_masks
+CELL_LINES = DEFAULT_GEOMETRY.cell_lines
+CENTER_RANK = DEFAULT_GEOMETRY.center_rank
+ZOBRIST_KEYS = DEFAULT_GEOMETRY.zobrist_keys
+SYMMETRIES = DEFAULT_GEOMETRY.symmetries
+
+# Identifica a função de avaliação (pontuações das janelas e da vitória); livros
+# de aberturas gerados com outra heurística são rejeitados
+HEURISTIC_TAG = 'windows-%08x' % zlib.crc32(repr(
+    (WIN_SCORE, [[window_value(x, o) for o in range(5)] for x in range(5)])).encode())
+
+# INVERSE_SYMMETRY[s] é a simetria que desfaz s (a mesma para qualquer tamanho)
+INVERSE_SYMMETRY = [next(t for t in range(8)
+                         if all(SYMMETRIES[t][SYMMETRIES[s][r][c][0]][SYMMETRIES[s][r][c][1]] == (r, c)
+                                for r in range(5) for c in range(5)))
+                    for s in range(8)]
+
 
 class TicTacToe5x5:
-    """Jogo da Velha 5x5 - objetivo: alinhar 4 peças"""
+    """Jogo da Velha 5x5 - objetivo: alinhar 4 peças
+
+    size e k generalizam o tabuleiro para N x N com vitória por K em linha
+    (ex.: TicTacToe5x5(6, 4), TicTacToe5x5(7, 5)); as tabelas de janelas,
+    Zobrist e simetrias vêm de board_geometry(size, k), geradas uma vez por
+    dimensão. TicTacToeNxN é um nome alternativo para a mesma classe.
+    """
     
-    def __init__(self):
-        self.board = [[' ' for _ in range(5)] for _ in range(5)]
+    def __init__(self, size: int = 5, k: int = 4):
+        self.geometry = board_geometry(size, k)
+        self.board = [[' ' for _ in range(size)] for _ in range(size)]
         self.current_player = 'X'
+        self.move_history: List[Tuple[int, int]] = []
+        # Chave Zobrist da posição, atualizada incrementalmente a cada jogada, e
+        # as chaves das 8 posições simétricas empacotadas (ver canonical_hash)
+        self.zobrist_hash = self.geometry.empty_key
+        self.symmetry_hashes = self.geometry.empty_symmetry_keys
+        # Peças de cada jogador por janela e pontuação heurística do ponto de
+        # vista de X, também atualizadas incrementalmente
+        self.x_counts = [0] * len(self.geometry.win_lines)
+        self.o_counts = [0] * len(self.geometry.win_lines)
+        self.window_score = 0
+        # Resultado em cache: vencedor (detectado pela última jogada) e nº de jogadas
+        self.winner: Optional[str] = None
+        self.move_count = 0
+        self._win_ply = 0
         
     def copy(self):
         """Cria uma cópia do estado atual"""
-        new_game = TicTacToe5x5()
+        new_game = self.__class__.__new__(self.__class__)
+        new_game.geometry = self.geometry
         new_game.board = [row[:] for row in self.board]
         new_game.current_player = self.current_player
+        new_game.move_history = self.move_history[:]
+        new_game.zobrist_hash = self.zobrist_hash
+        new_game.symmetry_hashes = self.symmetry_hashes
+        new_game.x_counts = self.x_counts[:]
+        new_game.o_counts = self.o_counts[:]
+        new_game.window_score = self.window_score
+        new_game.winner = self.winner
+        new_game.move_count = self.move_count
+        new_game._win_ply = self._win_ply
         return new_game
     
+    @property
+    def size(self) -> int:
+        """Número de linhas (e de colunas) do tabuleiro"""
+        return self.geometry.size
+    
+    @property
+    def k(self) -> int:
+        """Número de peças em linha necessárias para vencer"""
+        return self.geometry.k
+    
     def get_available_moves(self) -> List[Tuple[int, int]]:
         """Retorna lista de posições vazias"""
         moves = []
-        for i in range(5):
-            for j in range(5):
-                if self.board[i][j] == ' ':
+        for i, row in enumerate(self.board):
+            for j, piece in enumerate(row):
+                if piece == ' ':
                     moves.append((i, j))
         return moves
     
@@ -31,125 +235,528 @@ class TicTacToe5x5:
         """Faz uma jogada"""
         if self.board[row][col] == ' ':
             self.board[row][col] = self.current_player
+            self._record_move(row, col, self.current_player)
             self.current_player = 'O' if self.current_player == 'X' else 'X'
             return True
         return False
     
-    def check_winner(self) -> Optional[str]:
-        """Verifica se há um vencedor (4 em linha)"""
-        # Verifica linhas
-        for i in range(5):
-            for j in range(2):
-                if (self.board[i][j] != ' ' and
-                    self.board[i][j] == self.board[i][j+1] == 
-                    self.board[i][j+2] == self.board[i][j+3]):
-                    return self.board[i][j]
-        
-        # Verifica colunas
-        for j in range(5):
-            for i in range(2):
-                if (self.board[i][j] != ' ' and
-                    self.board[i][j] == self.board[i+1][j] == 
-                    self.board[i+2][j] == self.board[i+3][j]):
-                    return self.board[i][j]
-        
-        # Verifica diagonais (descendentes)
-        for i in range(2):
-            for j in range(2):
-                if (self.board[i][j] != ' ' and
-                    self.board[i][j] == self.board[i+1][j+1] == 
-                    self.board[i+2][j+2] == self.board[i+3][j+3]):
-                    return self.board[i][j]
-        
-        # Verifica diagonais (ascendentes)
-        for i in range(3, 5):
-            for j in range(2):
-                if (self.board[i][j] != ' ' and
-                    self.board[i][j] == self.board[i-1][j+1] == 
-                    self.board[i-2][j+2] == self.board[i-3][j+3]):
-                    return self.board[i][j]
+    def undo_move(self) -> Optional[Tuple[int, int]]:
+        """Desfaz a última jogada e a retorna (None se não houver jogadas)"""
+        if not self.move_history:
+            return None
+        row, col = self.move_history[-1]
+        self.board[row][col] = ' '
+        self.current_player = 'O' if self.current_player == 'X' else 'X'
+        self._unrecord_move(row, col, self.current_player)
+        return row, col
+    
+    @property
+    def last_move(self) -> Optional[Tuple[int, int]]:
+        """Última jogada feita (None no tabuleiro vazio)"""
+        return self.move_history[-1] if self.move_history else None
+    
+    def _record_move(self, row: int, col: int, player: str):
+        """Atualiza o estado incremental (histórico, Zobrist, janelas e vencedor)"""
+        geometry = self.geometry
+        self.move_history.append((row, col))
+        self.move_count += 1
+        self.zobrist_hash ^= geometry.zobrist_keys[player][row][col]
+        self.symmetry_hashes ^= geometry.symmetry_keys[player][row][col]
+        # Só as janelas que passam pela casa jogada podem ter sido completadas
+        if self._add_to_windows(row, col, player) and self.winner is None:
+            self.winner = player
+            self._win_ply = self.move_count
+    
+    def _unrecord_move(self, row: int, col: int, player: str):
+        """Desfaz _record_move para a última jogada"""
+        self.move_history.pop()
+        if self.winner is not None and self.move_count == self._win_ply:
+            self.winner = None
+        self.move_count -= 1
+        geometry = self.geometry
+        self.zobrist_hash ^= geometry.zobrist_keys[player][row][col]
+        self.symmetry_hashes ^= geometry.symmetry_keys[player][row][col]
+        self._remove_from_windows(row, col, player)
+    
+    def _add_to_windows(self, row: int, col: int, player: str) -> bool:
+        """Atualiza as contagens das janelas da casa ao colocar uma peça
         
-        return None
+        Retorna True se a peça completou alguma janela (k em linha).
+        """
+        geometry = self.geometry
+        x_counts, o_counts = self.x_counts, self.o_counts
+        k = geometry.k
+        score = self.window_score
+        completed = False
+        if player == 'X':
+            gain = geometry.x_gain
+            for w in geometry.cell_lines[row][col]:
+                score += gain[x_counts[w]][o_counts[w]]
+                x_counts[w] += 1
+                if x_counts[w] == k:
+                    completed = True
+        else:
+            gain = geometry.o_gain
+            for w in geometry.cell_lines[row][col]:
+                score += gain[x_counts[w]][o_counts[w]]
+                o_counts[w] += 1
+                if o_counts[w] == k:
+                    completed = True
+        self.window_score = score
+        return completed
+    
+    def _remove_from_windows(self, row: int, col: int, player: str):
+        """Desfaz _add_to_windows ao retirar uma peça"""
+        geometry = self.geometry
+        x_counts, o_counts = self.x_counts, self.o_counts
+        score = self.window_score
+        if player == 'X':
+            gain = geometry.x_gain
+            for w in geometry.cell_lines[row][col]:
+                x_counts[w] -= 1
+                score -= gain[x_counts[w]][o_counts[w]]
+        else:
+            gain = geometry.o_gain
+            for w in geometry.cell_lines[row][col]:
+                o_counts[w] -= 1
+                score -= gain[x_counts[w]][o_counts[w]]
+        self.window_score = score
+    
+    def canonical_hash(self) -> Tuple[int, int]:
+        """Chave Zobrist canônica (a menor entre as 8 posições simétricas)
+        
+        Retorna (chave, s), onde s é a simetria que leva a posição à forma canônica.
+        """
+        packed = self.symmetry_hashes
+        best_key, best_sym = packed & _HASH_MASK, 0
+        for s in range(1, 8):
+            key = (packed >> (64 * s)) & _HASH_MASK
+            if key < best_key:
+                best_key, best_sym = key, s
+        return best_key, best_sym
+    
+    def evaluate(self, player: str) -> int:
+        """Pontuação heurística das janelas do ponto de vista do jogador (custo O(1))"""
+        return self.window_score if player == 'X' else -self.window_score
+    
+    def check_winner(self) -> Optional[str]:
+        """Retorna o vencedor (k em linha), mantido em cache a cada jogada"""
+        return self.winner
     
     def is_terminal(self) -> bool:
         """Verifica se o jogo terminou"""
-        return self.check_winner() is not None or len(self.get_available_moves()) == 0
+        return self.winner is not None or self.move_count == self.geometry.cells
     
     def get_utility(self, player: str) -> int:
         """Retorna a utilidade do estado para um jogador"""
-        winner = self.check_winner()
+        winner = self.winner
         if winner == player:
-            return 1000
+            return WIN_SCORE
         elif winner is not None:
-            return -1000
+            return -WIN_SCORE
         return 0
     
     def print_board(self):
         """Imprime o tabuleiro"""
-        print("\n  0 1 2 3 4")
+        width = len(str(self.size - 1))
+        print("\n" + " " * (width + 1) + " ".join(str(c).rjust(width) for c in range(self.size)))
         for i, row in enumerate(self.board):
-            print(f"{i} {' '.join(row)}")
+            print(f"{str(i).rjust(width)} {' '.join(p.rjust(width) for p in row)}")
         print()
 
 
+TicTacToeNxN = TicTacToe5x5
+
+
+class BitboardTicTacToe5x5(TicTacToe5x5):
+    """Jogo da Velha 5x5 com tabuleiro em bitboards (um inteiro de 25 bits por jogador)
+
+    A casa (linha, coluna) corresponde ao bit linha*size + coluna. Mantém a mesma
+    API pública de TicTacToe5x5 (inclusive size e k), mas a cópia custa apenas
+    dois inteiros.
+    """
+
+    def __init__(self, size: int = 5, k: int = 4):
+        self.geometry = board_geometry(size, k)
+        self.x_bits = 0
+        self.o_bits = 0
+        self.current_player = 'X'
+        self.move_history: List[Tuple[int, int]] = []
+        self.zobrist_hash = self.geometry.empty_key
+        self.symmetry_hashes = self.geometry.empty_symmetry_keys
+        self.x_counts = [0] * len(self.geometry.win_lines)
+        self.o_counts = [0] * len(self.geometry.win_lines)
+        self.window_score = 0
+        self.winner: Optional[str] = None
+        self.move_count = 0
+        self._win_ply = 0
+        self._board_view = None
+
+    @property
+    def board(self) -> List[List[str]]:
+        """Visão do tabuleiro como lista de listas (somente leitura, recriada após cada jogada)"""
+        if self._board_view is None:
+            size = self.geometry.size
+            board = [[' ' for _ in range(size)] for _ in range(size)]
+            for idx in range(self.geometry.cells):
+                bit = 1 << idx
+                if self.x_bits & bit:
+                    board[idx // size][idx % size] = 'X'
+                elif self.o_bits & bit:
+                    board[idx // size][idx % size] = 'O'
+            self._board_view = board
+        return self._board_view
+
+    def copy(self):
+        """Cria uma cópia do estado atual"""
+        new_game = self.__class__.__new__(self.__class__)
+        new_game.geometry = self.geometry
+        new_game.x_bits = self.x_bits
+        new_game.o_bits = self.o_bits
+        new_game.current_player = self.current_player
+        new_game.move_history = self.move_history[:]
+        new_game.zobrist_hash = self.zobrist_hash
+        new_game.symmetry_hashes = self.symmetry_hashes
+        new_game.x_counts = self.x_counts[:]
+        new_game.o_counts = self.o_counts[:]
+        new_game.window_score = self.window_score
+        new_game.winner = self.winner
+        new_game.move_count = self.move_count
+        new_game._win_ply = self._win_ply
+        new_game._board_view = None
+        return new_game
+
+    def get_available_moves(self) -> List[Tuple[int, int]]:
+        """Retorna lista de posições vazias (em ordem linha-coluna)"""
+        size = self.geometry.size
+        empty = self.geometry.full_mask & ~(self.x_bits | self.o_bits)
+        moves = []
+        while empty:
+            low = empty & -empty
+            moves.append(divmod(low.bit_length() - 1, size))
+            empty ^= low
+        return moves
+
+    def make_move(self, row: int, col: int) -> bool:
+        """Faz uma jogada"""
+        bit = 1 << (row * self.geometry.size + col)
+        if (self.x_bits | self.o_bits) & bit:
+            return False
+        self._record_move(row, col, self.current_player)
+        if self.current_player == 'X':
+            self.x_bits |= bit
+            self.current_player = 'O'
+        else:
+            self.o_bits |= bit
+            self.current_player = 'X'
+        self._board_view = None
+        return True
+
+    def undo_move(self) -> Optional[Tuple[int, int]]:
+        """Desfaz a última jogada e a retorna (None se não houver jogadas)"""
+        if not self.move_history:
+            return None
+        row, col = self.move_history[-1]
+        bit = 1 << (row * self.geometry.size + col)
+        if self.current_player == 'X':
+            self.o_bits &= ~bit
+            self.current_player = 'O'
+        else:
+            self.x_bits &= ~bit
+            self.current_player = 'X'
+        self._unrecord_move(row, col, self.current_player)
+        self._board_view = None
+        return row, col
+
+
+BitboardTicTacToeNxN = BitboardTicTacToe5x5
+
+
+def transform_move(move: Tuple[int, int], symmetry: int,
+                   geometry: Optional[BoardGeometry] = None) -> Tuple[int, int]:
+    """Aplica uma das 8 simetrias a uma casa (do tabuleiro 5x5, ou da geometria dada)"""
+    symmetries = SYMMETRIES if geometry is None else geometry.symmetries
+    return symmetries[symmetry][move[0]][move[1]]
+
+
+def canonical_form(game: TicTacToe5x5) -> Tuple[int, int]:
+    """Forma canônica da posição sob as 8 simetrias do tabuleiro
+    
+    A posição é codificada como x_bits | (o_bits << N*N) (bit linha*N + coluna);
+    retorna (menor código entre as 8 simetrias, simetria que o produz).
+    Posições simétricas têm a mesma forma canônica.
+    """
+    geometry = game.geometry
+    size, cells, symmetries = geometry.size, geometry.cells, geometry.symmetries
+    board = game.board
+    best_code, best_sym = None, 0
+    for s in range(8):
+        code = 0
+        for r in range(size):
+            for c in range(size):
+                piece = board[r][c]
+                if piece != ' ':
+                    tr, tc = symmetries[s][r][c]
+                    code |= 1 << (tr * size + tc + (0 if piece == 'X' else cells))
+        if best_code is None or code < best_code:
+            best_code, best_sym = code, s
+    return best_code, best_sym
+
+
+def unique_moves(game: TicTacToe5x5, moves: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    """Remove jogadas equivalentes por simetria, mantendo a primeira de cada classe
+    
+    Só as simetrias que preservam a posição atual geram jogadas equivalentes;
+    no tabuleiro vazio, por exemplo, restam 6 das 25 jogadas.
+    """
+    board = game.board
+    symmetries = game.geometry.symmetries
+    cells = [(r, c) for r in range(game.size) for c in range(game.size)]
+    stabilizer = [s for s in range(1, 8)
+                  if all(board[symmetries[s][r][c][0]][symmetries[s][r][c][1]] == board[r][c]
+                         for r, c in cells)]
+    if not stabilizer:
+        return moves
+    seen = set()
+    unique = []
+    for move in moves:
+        if move in seen:
+            continue
+        unique.append(move)
+        for s in stabilizer:
+            seen.add(transform_move(move, s, game.geometry))
+    return unique
+
+
+class TranspositionTable:
+    """Tabela de transposição limitada, indexada pela chave Zobrist
+
+    Cada entrada guarda (chave, profundidade, valor, tipo de limite, melhor jogada).
+    Políticas de substituição:
+    - 'depth': só substitui uma entrada de outra posição se a nova busca for
+      pelo menos tão profunda quanto a armazenada
+    - 'always': a entrada mais recente sempre substitui a anterior
+    """
+
+    EXACT = 0
+    LOWER = 1  # valor é limite inferior (corte beta)
+    UPPER = 2  # valor é limite superior (nenhum filho superou alfa)
+
+    REPLACEMENT_POLICIES = ('depth', 'always')
+
+    def __init__(self, size: int = 1 << 16, replacement: str = 'depth'):
+        if size <= 0:
+            raise ValueError("size deve ser positivo")
+        if replacement not in self.REPLACEMENT_POLICIES:
+            raise ValueError(f"Política de substituição inválida: {replacement}")
+        self.size = size
+        self.replacement = replacement
+        self.slots: List[Optional[tuple]] = [None] * size
+
+    def probe(self, key: int) -> Optional[tuple]:
+        """Retorna a entrada do slot da chave (pode pertencer a outra posição)"""
+        return self.slots[key % self.size]
+
+    def store(self, key: int, depth: int, value: float, flag: int,
+              move: Optional[Tuple[int, int]]):
+        """Armazena o resultado de uma busca, respeitando a política de substituição"""
+        index = key % self.size
+        old = self.slots[index]
+        if (self.replacement == 'depth' and old is not None
+                and old[0] != key and old[1] > depth):
+            return
+        self.slots[index] = (key, depth, value, flag, move)
+
+    def clear(self):
+        """Remove todas as entradas"""
+        self.slots = [None] * self.size
+
+
+class EvaluationCache:
+    """Cache limitado de avaliações heurísticas, indexado pela chave Zobrist
+
+    Os valores ficam do ponto de vista de X, então a mesma instância pode ser
+    compartilhada por agentes dos dois jogadores, entre jogadas e partidas.
+    Políticas de remoção quando o cache enche:
+    - 'lru': remove a entrada usada há mais tempo
+    - 'clock': aproximação do LRU com um bit de referência por entrada
+    """
+
+    EVICTION_POLICIES = ('lru', 'clock')
+
+    def __init__(self, capacity: int = 1 << 16, policy: str = 'lru'):
+        if capacity <= 0:
+            raise ValueError("capacity deve ser positiva")
+        if policy not in self.EVICTION_POLICIES:
+            raise ValueError(f"Política de remoção inválida: {policy}")
+        self.capacity = capacity
+        self.policy = policy
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries) if self.policy == 'lru' else len(self._slots)
+
+    @property
+    def hit_rate(self) -> float:
+        """Fração das consultas respondidas pelo cache"""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def get(self, key: int) -> Optional[int]:
+        """Valor armazenado para a chave (None se ausente)"""
+        if self.policy == 'lru':
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+        else:
+            slot = self._slots.get(key)
+            value = None
+            if slot is not None:
+                self._referenced[slot] = 1
+                value = self._values[slot]
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def put(self, key: int, value: int):
+        """Armazena um valor, removendo uma entrada antiga se necessário"""
+        if self.policy == 'lru':
+            entries = self._entries
+            entries[key] = value
+            entries.move_to_end(key)
+            if len(entries) > self.capacity:
+                entries.popitem(last=False)
+                self.evictions += 1
+            return
+
+        slot = self._slots.get(key)
+        if slot is None:
+            if len(self._keys) < self.capacity:
+                slot = len(self._keys)
+                self._keys.append(key)
+                self._values.append(value)
+                self._referenced.append(0)
+            else:
+                # Ponteiro do relógio: pula (e limpa) entradas referenciadas
+                while self._referenced[self._hand]:
+                    self._referenced[self._hand] = 0
+                    self._hand = (self._hand + 1) % self.capacity
+                slot = self._hand
+                self._hand = (self._hand + 1) % self.capacity
+                del self._slots[self._keys[slot]]
+                self._keys[slot] = key
+                self.evictions += 1
+            self._slots[key] = slot
+        self._values[slot] = value
+
+    def clear(self):
+        """Remove todas as entradas (as estatísticas são mantidas)"""
+        self._entries: 'OrderedDict[int, int]' = OrderedDict()
+        self._slots: Dict[int, int] = {}
+        self._keys: List[int] = []
+        self._values: List[int] = []
+        self._referenced = bytearray()
+        self._hand = 0
+
+    def reset_stats(self):
+        """Zera os contadores de acertos, falhas e remoções"""
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+
+# Caches compartilhados por todos os agentes do processo, por (capacidade, política)
+_shared_eval_caches: Dict[Tuple[int, str], EvaluationCache] = {}
+
+
+def shared_evaluation_cache(capacity: int = 1 << 16, policy: str = 'lru') -> EvaluationCache:
+    """Cache de avaliações único no processo para a capacidade e política dadas"""
+    cache = _shared_eval_caches.get((capacity, policy))
+    if cache is None:
+        cache = EvaluationCache(capacity, policy)
+        _shared_eval_caches[(capacity, policy)] = cache
+    return cache
+
+
+def _cached_evaluation(cache: Optional[EvaluationCache], game: TicTacToe5x5,
+                       player: str) -> int:
+    """Avaliação heurística do ponto de vista do jogador, consultando o cache"""
+    if cache is None:
+        return game.evaluate(player)
+    key = game.zobrist_hash
+    value = cache.get(key)
+    if value is None:
+        value = game.evaluate('X')
+        cache.put(key, value)
+    return value if player == 'X' else -value
+
+
+def _check_opening_book(book, max_depth: int):
+    """Rejeita livros de aberturas mais rasos que a busca do agente"""
+    if book is not None and book.depth < max_depth:
+        raise ValueError(f"Livro de aberturas com profundidade {book.depth} "
+                         f"é mais raso que a busca do agente ({max_depth})")
+
+
+def _book_move(book, game: TicTacToe5x5) -> Optional[Tuple[int, int]]:
+    """Jogada do livro de aberturas para a posição, se houver"""
+    if book is None:
+        return None
+    found = book.lookup(game)
+    return found[0] if found is not None else None
+
+
+def _make_threat_search(max_threats: int):
+    """Cria a busca de ameaças do agente (None se desabilitada)"""
+    if max_threats <= 0:
+        return None
+    from threat_search import ThreatSearch
+    return ThreatSearch(max_threats)
+
+
+def _threat_move(searcher, game: TicTacToe5x5) -> Optional[Tuple[int, int]]:
+    """Primeira jogada de uma vitória forçada por ameaças, se houver"""
+    if searcher is None:
+        return None
+    return searcher.find_forced_win(game)
+
+
 class MinimaxAgent:
-    """Agente usando Minimax básico"""
+    """Agente usando Minimax básico
+    
+    opening_book (opening_book.OpeningBook) responde jogadas de abertura sem busca
+    e tablebase (endgame_tablebase.EndgameTablebase) joga os finais perfeitamente.
+    Com threat_search > 0, antes da busca procura uma vitória forçada por
+    ameaças com até esse número de jogadas (threat_search.ThreatSearch).
+    eval_cache (EvaluationCache) memoriza as avaliações heurísticas.
+    """
     
-    def __init__(self, player: str, max_depth: int = 4):
+    def __init__(self, player: str, max_depth: int = 4, opening_book=None,
+                 tablebase=None, threat_search: int = 0,
+                 eval_cache: Optional[EvaluationCache] = None):
+        _check_opening_book(opening_book, max_depth)
         self.player = player
         self.opponent = 'O' if player == 'X' else 'X'
         self.max_depth = max_depth
+        self.opening_book = opening_book
+        self.tablebase = tablebase
+        self.threat_search = threat_search
+        self._threat_search = _make_threat_search(threat_search)
+        self.eval_cache = eval_cache
         self.nodes_visited = 0
         
     def heuristic(self, game: TicTacToe5x5) -> int:
-        """Função heurística para estados não-terminais"""
-        score = 0
-        
-        # Avalia todas as possíveis sequências de 4
-        for i in range(5):
-            for j in range(5):
-                # Horizontal
-                if j <= 1:
-                    score += self._evaluate_sequence(game, i, j, 0, 1)
-                # Vertical
-                if i <= 1:
-                    score += self._evaluate_sequence(game, i, j, 1, 0)
-                # Diagonal descendente
-                if i <= 1 and j <= 1:
-                    score += self._evaluate_sequence(game, i, j, 1, 1)
-                # Diagonal ascendente
-                if i >= 3 and j <= 1:
-                    score += self._evaluate_sequence(game, i, j, -1, 1)
-        
-        return score
-    
-    def _evaluate_sequence(self, game: TicTacToe5x5, row: int, col: int, 
-                          dr: int, dc: int) -> int:
-        """Avalia uma sequência de 4 posições"""
-        player_count = 0
-        opponent_count = 0
-        empty_count = 0
-        
-        for k in range(4):
-            r, c = row + k*dr, col + k*dc
-            if game.board[r][c] == self.player:
-                player_count += 1
-            elif game.board[r][c] == self.opponent:
-                opponent_count += 1
-            else:
-                empty_count += 1
-        
-        # Se ambos os jogadores têm peças, a sequência é inútil
-        if player_count > 0 and opponent_count > 0:
-            return 0
-        
-        # Pontuação baseada no número de peças
-        if player_count > 0:
-            return 10 ** player_count
-        elif opponent_count > 0:
-            return -(10 ** opponent_count)
+        """Função heurística para estados não-terminais
         
-        return 0
+        Soma window_value sobre as 28 janelas; o tabuleiro mantém essa soma
+        atualizada a cada jogada, então a leitura é O(1).
+        """
+        return _cached_evaluation(self.eval_cache, game, self.player)
     
     def minimax(self, game: TicTacToe5x5, depth: int, 
                 is_maximizing: bool) -> Tuple[int, Optional[Tuple[int, int]]]:
@@ -157,21 +764,25 @@ class MinimaxAgent:
         self.nodes_visited += 1
         
         # Caso base: estado terminal ou profundidade máxima
-        if depth == 0 or game.is_terminal():
-            if game.is_terminal():
-                return game.get_utility(self.player), None
-            else:
-                return self.heuristic(game), None
+        # (vencedor e tabuleiro cheio ficam em cache no estado do jogo)
+        winner = game.winner
+        if winner is not None:
+            return (WIN_SCORE if winner == self.player else -WIN_SCORE), None
+        if game.is_terminal():
+            return 0, None
+        if depth == 0:
+            return self.heuristic(game), None
         
         moves = game.get_available_moves()
+        
         best_move = None
         
         if is_maximizing:
             max_eval = float('-inf')
             for move in moves:
-                new_game = game.copy()
-                new_game.make_move(move[0], move[1])
-                eval_score, _ = self.minimax(new_game, depth - 1, False)
+                game.make_move(move[0], move[1])
+                eval_score, _ = self.minimax(game, depth - 1, False)
+                game.undo_move()
                 
                 if eval_score > max_eval:
                     max_eval = eval_score
@@ -181,9 +792,9 @@ class MinimaxAgent:
         else:
             min_eval = float('inf')
             for move in moves:
-                new_game = game.copy()
-                new_game.make_move(move[0], move[1])
-                eval_score, _ = self.minimax(new_game, depth - 1, True)
+                game.make_move(move[0], move[1])
+                eval_score, _ = self.minimax(game, depth - 1, True)
+                game.undo_move()
                 
                 if eval_score < min_eval:
                     min_eval = eval_score
@@ -194,123 +805,1059 @@ class MinimaxAgent:
     def get_best_move(self, game: TicTacToe5x5) -> Tuple[int, int]:
         """Retorna a melhor jogada"""
         self.nodes_visited = 0
+        book_move = _book_move(self.opening_book, game)
+        if book_move is not None:
+            return book_move
+        if self.tablebase is not None and self.tablebase.covers(game):
+            return self.tablebase.best_move(game)
+        threat_move = _threat_move(self._threat_search, game)
+        if self._threat_search is not None:
+            self.nodes_visited += self._threat_search.nodes_visited
+        if threat_move is not None:
+            return threat_move
         is_maximizing = (game.current_player == self.player)
-        _, move = self.minimax(game, self.max_depth, is_maximizing)
+        # Uma única cópia por jogada; a busca faz/desfaz jogadas nela
+        _, move = self.minimax(game.copy(), self.max_depth, is_maximizing)
         return move
 
 
+class _SearchTimeout(Exception):
+    """Interrompe a busca quando o orçamento de tempo da jogada se esgota"""
+
+
+class SearchStats:
+    """Estatísticas da busca de uma jogada (ver AlphaBetaAgent(collect_stats=True))
+    
+    Tempos em nanossegundos (time.perf_counter_ns). Nós folha são os que não
+    geraram filhos: vitória, empate, horizonte, tabela de finais, corte pela
+    tabela de transposição ou filhos avaliados em lote.
+    """
+    
+    def __init__(self, player: str, max_depth: int):
+        self.player = player
+        self.move: Optional[Tuple[int, int]] = None
+        self.value: Optional[float] = None
+        self.depth = 0
+        self.nodes = 0
+        self.nodes_per_ply = [0] * (max_depth + 1)
+        self.interior_nodes = 0
+        self.cutoffs = 0
+        self.first_move_cutoffs = 0
+        self.re_searches = 0
+        self.aspiration_failures = 0
+        self.tt_hits = 0
+        self.tt_misses = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.heuristic_ns = 0
+        self.movegen_ns = 0
+        self.elapsed_ns = 0
+    
+    def merge(self, other: 'SearchStats'):
+        """Soma os contadores da busca de uma subárvore feita em outro processo
+        
+        Nós, valor, profundidade e tabela de transposição vêm dos contadores do
+        agente (ver AlphaBetaAgent._finish_stats) e não são somados aqui.
+        """
+        for ply, count in enumerate(other.nodes_per_ply):
+            self.nodes_per_ply[ply] += count
+        self.interior_nodes += other.interior_nodes
+        self.cutoffs += other.cutoffs
+        self.first_move_cutoffs += other.first_move_cutoffs
+        self.heuristic_ns += other.heuristic_ns
+        self.movegen_ns += other.movegen_ns
+    
+    def record_cutoff(self, move_index: int):
+        """Registra uma poda causada pela jogada de índice move_index do nó"""
+        self.cutoffs += 1
+        if move_index == 0:
+            self.first_move_cutoffs += 1
+    
+    @property
+    def leaf_nodes(self) -> int:
+        return sum(self.nodes_per_ply) - self.interior_nodes
+    
+    @property
+    def effective_branching_factor(self) -> float:
+        """Fator de ramificação efetivo: nós ** (1 / profundidade)"""
+        return self.nodes ** (1 / self.depth) if self.depth > 0 and self.nodes > 0 else 0.0
+    
+    @property
+    def first_move_cutoff_rate(self) -> float:
+        """Fração das podas causadas pela primeira jogada testada"""
+        return self.first_move_cutoffs / self.cutoffs if self.cutoffs else 0.0
+    
+    @property
+    def tt_hit_rate(self) -> float:
+        lookups = self.tt_hits + self.tt_misses
+        return self.tt_hits / lookups if lookups else 0.0
+    
+    @property
+    def cache_hit_rate(self) -> float:
+        lookups = self.cache_hits + self.cache_misses
+        return self.cache_hits / lookups if lookups else 0.0
+    
+    def as_dict(self) -> dict:
+        """Representação serializável em JSON, com as taxas derivadas"""
+        data = dict(self.__dict__)
+        data['move'] = list(self.move) if self.move is not None else None
+        data['nodes_per_ply'] = list(self.nodes_per_ply)
+        data['leaf_nodes'] = self.leaf_nodes
+        data['effective_branching_factor'] = self.effective_branching_factor
+        data['first_move_cutoff_rate'] = self.first_move_cutoff_rate
+        data['tt_hit_rate'] = self.tt_hit_rate
+        data['cache_hit_rate'] = self.cache_hit_rate
+        return data
+
+
 class AlphaBetaAgent:
-    """Agente usando Minimax com Poda Alfa-Beta"""
+    """Agente usando Minimax com Poda Alfa-Beta
+    
+    Com tt_size > 0 usa uma tabela de transposição com esse número de entradas,
+    mantida entre as jogadas do agente. Os valores são guardados do ponto de
+    vista do agente, então a tabela não deve ser compartilhada entre jogadores.
+    
+    Com time_limit (segundos) a jogada é escolhida por aprofundamento iterativo:
+    busca com profundidade 1, 2, ... até max_depth ou até o tempo acabar, e
+    retorna a melhor jogada da última iteração completa.
+    
+    move_ordering habilita heuristicas de ordenação de jogadas (combináveis):
+    - 'center': ordem estática do centro para as bordas
+    - 'tt': melhor jogada da tabela de transposição primeiro (requer tt_size > 0)
+    - 'killers': duas jogadas "assassinas" por nível que causaram poda
+    - 'history': tabela de histórico de podas por jogador e casa
+    Sem ordenação, as jogadas são testadas em ordem linha-coluna.
+    
+    Com use_symmetry=True as jogadas da raiz equivalentes por simetria são
+    descartadas e a tabela de transposição usa a chave canônica da posição
+    (as 8 rotações/reflexões compartilham a mesma entrada).
+    
+    Com workers > 1 (e sem limite de tempo) a raiz é dividida entre processos:
+    a primeira jogada é buscada com janela completa e as demais em paralelo
+    com o limite obtido (Young Brothers Wait). Para a mesma ordem na raiz, a
+    jogada escolhida é a mesma da busca serial.
+    
+    opening_book (opening_book.OpeningBook) responde jogadas de abertura sem
+    busca. Com tablebase (endgame_tablebase.EndgameTablebase), posições com
+    poucas casas vazias recebem o valor exato da tabela em vez da heurística,
+    e na raiz a jogada perfeita é devolvida sem busca. O valor da última busca
+    fica em best_value.
+    
+    Com threat_search > 0, antes da busca completa procura uma vitória forçada
+    por sequência de ameaças com até esse número de jogadas
+    (threat_search.ThreatSearch); se houver, a jogada sai sem busca. Os nós
+    da busca de ameaças entram em nodes_visited.
+    
+    eval_cache (EvaluationCache, ver shared_evaluation_cache) memoriza as
+    avaliações heurísticas entre jogadas e partidas; pode ser compartilhado
+    por vários agentes.
+    
+    Com collect_stats=True cada jogada produz um SearchStats (nós por nível,
+    folhas e nós internos, podas na primeira jogada, taxas de acerto da
+    tabela e do cache, tempos da heurística e da geração de jogadas), guardado
+    em last_stats e passado a cada função de stats_hooks.
+    
+    Com batch_eval=True (requer NumPy), os filhos de cada nó no horizonte são
+    gerados e avaliados em uma única chamada vetorizada (vectorized.score_children);
+    nós, podas e jogada escolhida são os mesmos da busca normal.
+    """
+    
+    # Intervalo (em nós) entre consultas ao relógio durante a busca
+    TIME_CHECK_INTERVAL = 1024
     
-    def __init__(self, player: str, max_depth: int = 4):
+    MOVE_ORDERINGS = ('center', 'tt', 'killers', 'history')
+    
+    def __init__(self, player: str, max_depth: int = 4, tt_size: int = 0,
+                 tt_replacement: str = 'depth', time_limit: Optional[float] = None,
+                 move_ordering: Tuple[str, ...] = (), workers: int = 1,
+                 use_symmetry: bool = False, opening_book=None, tablebase=None,
+                 batch_eval: bool = False, threat_search: int = 0,
+                 eval_cache: Optional[EvaluationCache] = None,
+                 collect_stats: bool = False, stats_hooks=()):
+        for name in move_ordering:
+            if name not in self.MOVE_ORDERINGS:
+                raise ValueError(f"Ordenação de jogadas desconhecida: {name}")
+        if time_limit is None:
+            _check_opening_book(opening_book, max_depth)
         self.player = player
         self.opponent = 'O' if player == 'X' else 'X'
         self.max_depth = max_depth
+        self.time_limit = time_limit
+        self.move_ordering = tuple(move_ordering)
+        self.workers = workers
+        self.use_symmetry = use_symmetry
+        self.opening_book = opening_book
+        self.tablebase = tablebase
+        self.batch_eval = batch_eval
+        self._score_children = None
+        if batch_eval:
+            from vectorized import score_children
+            self._score_children = score_children
+        self.threat_search = threat_search
+        self._threat_search = _make_threat_search(threat_search)
+        self.eval_cache = eval_cache
+        self.collect_stats = collect_stats or bool(stats_hooks)
+        self.stats_hooks = list(stats_hooks)
+        self.last_stats: Optional[SearchStats] = None
+        self._stats: Optional[SearchStats] = None
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._killers: List[List[Optional[Tuple[int, int]]]] = []
+        self._history = {p: [[0] * 5 for _ in range(5)] for p in ('X', 'O')}
         self.nodes_visited = 0
         self.pruned_branches = 0
+        self.completed_depth = 0
+        self.best_value: Optional[float] = None
+        self.tt = TranspositionTable(tt_size, tt_replacement) if tt_size > 0 else None
+        self.tt_hits = 0
+        self.tt_misses = 0
+        self.tt_collisions = 0
+        # Estado do aprofundamento iterativo (só usado com limite de tempo)
+        self._deadline: Optional[float] = None
+        self._next_time_check = 0
+        self._root_depth = 0
+        self._root_history_len = 0
+        self._pv: Optional[List[List[Tuple[int, int]]]] = None
+        self._previous_pv: List[Tuple[int, int]] = []
+        # Sem tempo para resolver finais: a busca só consulta posições já resolvidas
+        self._tablebase_lookup_only = False
         
     def heuristic(self, game: TicTacToe5x5) -> int:
         """Função heurística para estados não-terminais"""
-        score = 0
-        
-        for i in range(5):
-            for j in range(5):
-                if j <= 1:
-                    score += self._evaluate_sequence(game, i, j, 0, 1)
-                if i <= 1:
-                    score += self._evaluate_sequence(game, i, j, 1, 0)
-                if i <= 1 and j <= 1:
-                    score += self._evaluate_sequence(game, i, j, 1, 1)
-                if i >= 3 and j <= 1:
-                    score += self._evaluate_sequence(game, i, j, -1, 1)
-        
-        return score
-    
-    def _evaluate_sequence(self, game: TicTacToe5x5, row: int, col: int, 
-                          dr: int, dc: int) -> int:
-        """Avalia uma sequência de 4 posições"""
-        player_count = 0
-        opponent_count = 0
-        
-        for k in range(4):
-            r, c = row + k*dr, col + k*dc
-            if game.board[r][c] == self.player:
-                player_count += 1
-            elif game.board[r][c] == self.opponent:
-                opponent_count += 1
-        
-        if player_count > 0 and opponent_count > 0:
-            return 0
-        
-        if player_count > 0:
-            return 10 ** player_count
-        elif opponent_count > 0:
-            return -(10 ** opponent_count)
+        return _cached_evaluation(self.eval_cache, game, self.player)
+    
+    def _check_time(self):
+        """Consulta o relógio e agenda a próxima consulta
         
-        return 0
+        Por limiar, e não por múltiplo, porque os filhos avaliados em lote
+        avançam nodes_visited sem passar pela entrada da busca.
+        """
+        self._next_time_check = self.nodes_visited + self.TIME_CHECK_INTERVAL
+        if time.perf_counter() >= self._deadline:
+            raise _SearchTimeout()
+    
+    def _probe_tablebase(self, game: TicTacToe5x5, player: str) -> Optional[int]:
+        """Valor exato da tabela de finais para o jogador, ou None se indisponível"""
+        if self.tablebase is None or not self.tablebase.covers(game):
+            return None
+        if self._tablebase_lookup_only:
+            value = self.tablebase.known_value(game, player)
+            return None if value is None else value * WIN_SCORE
+        return self.tablebase.value(game, player, self._deadline) * WIN_SCORE
     
     def alpha_beta(self, game: TicTacToe5x5, depth: int, alpha: float, 
                    beta: float, is_maximizing: bool) -> Tuple[int, Optional[Tuple[int, int]]]:
         """Algoritmo Minimax com Poda Alfa-Beta"""
-        self.nodes_visited += 1
-        
-        if depth == 0 or game.is_terminal():
-            if game.is_terminal():
-                return game.get_utility(self.player), None
-            else:
-                return self.heuristic(game), None
+        value = self._enter_node(game, depth, self.player)
+        if value is not None:
+            return value, None
         
-        moves = game.get_available_moves()
+        ply = self._root_depth - depth
+        alpha_orig, beta_orig = alpha, beta
+        tt_key, tt_sym, tt_move, alpha, beta, cutoff = self._probe_tt(game, depth, alpha, beta)
+        if cutoff is not None:
+            return cutoff
+        moves, child_values = self._prepare_moves(game, depth, tt_move, self.player)
+        pv = self._pv
         best_move = None
         
         if is_maximizing:
-            max_eval = float('-inf')
-            for move in moves:
-                new_game = game.copy()
-                new_game.make_move(move[0], move[1])
-                eval_score, _ = self.alpha_beta(new_game, depth - 1, alpha, beta, False)
+            best_eval = float('-inf')
+            for i, move in enumerate(moves):
+                if child_values is not None:
+                    eval_score = self._batched_child(child_values, i, ply)
+                else:
+                    game.make_move(move[0], move[1])
+                    eval_score, _ = self.alpha_beta(game, depth - 1, alpha, beta, False)
+                    game.undo_move()
                 
-                if eval_score > max_eval:
-                    max_eval = eval_score
+                if eval_score > best_eval:
+                    best_eval = eval_score
                     best_move = move
+                    if pv is not None:
+                        pv[ply] = [move] + pv[ply + 1]
                 
                 alpha = max(alpha, eval_score)
                 if beta <= alpha:
-                    self.pruned_branches += 1
+                    self._record_cutoff(game, move, ply, depth, i)
                     break  # Poda Beta
-            
-            return max_eval, best_move
         else:
-            min_eval = float('inf')
-            for move in moves:
-                new_game = game.copy()
-                new_game.make_move(move[0], move[1])
-                eval_score, _ = self.alpha_beta(new_game, depth - 1, alpha, beta, True)
+            best_eval = float('inf')
+            for i, move in enumerate(moves):
+                if child_values is not None:
+                    eval_score = self._batched_child(child_values, i, ply)
+                else:
+                    game.make_move(move[0], move[1])
+                    eval_score, _ = self.alpha_beta(game, depth - 1, alpha, beta, True)
+                    game.undo_move()
                 
-                if eval_score < min_eval:
-                    min_eval = eval_score
+                if eval_score < best_eval:
+                    best_eval = eval_score
                     best_move = move
+                    if pv is not None:
+                        pv[ply] = [move] + pv[ply + 1]
                 
                 beta = min(beta, eval_score)
                 if beta <= alpha:
-                    self.pruned_branches += 1
+                    self._record_cutoff(game, move, ply, depth, i)
                     break  # Poda Alfa
-            
-            return min_eval, best_move
+        
+        self._store_tt(game, tt_key, tt_sym, depth, best_eval, best_move, alpha_orig, beta_orig)
+        return best_eval, best_move
     
-    def get_best_move(self, game: TicTacToe5x5) -> Tuple[int, int]:
-        """Retorna a melhor jogada"""
+    def _enter_node(self, game: TicTacToe5x5, depth: int, player: str) -> Optional[int]:
+        """Conta o nó e, se não houver o que buscar, devolve seu valor para player
+        
+        O valor vem do fim de jogo, da tabela de finais ou da heurística no
+        horizonte; nos nós internos devolve None.
+        """
+        self.nodes_visited += 1
+        if self._deadline is not None and self.nodes_visited >= self._next_time_check:
+            self._check_time()
+        
+        ply = self._root_depth - depth
+        if self._pv is not None:
+            self._pv[ply] = []
+        stats = self._stats
+        if stats is not None:
+            stats.nodes_per_ply[ply] += 1
+        
+        winner = game.winner
+        if winner is not None:
+            return WIN_SCORE if winner == player else -WIN_SCORE
+        if game.is_terminal():
+            return 0
+        value = self._probe_tablebase(game, player)
+        if value is not None or depth > 0:
+            return value
+        if stats is None:
+            value = self.heuristic(game)
+        else:
+            start = time.perf_counter_ns()
+            value = self.heuristic(game)
+            stats.heuristic_ns += time.perf_counter_ns() - start
+        return value if player == self.player else -value
+    
+    def _probe_tt(self, game: TicTacToe5x5, depth: int, alpha: float, beta: float):
+        """Consulta à tabela de transposição
+        
+        Devolve (chave, simetria, jogada da tabela, alpha, beta, resultado), com
+        a janela estreitada pela entrada e o resultado do nó quando a entrada
+        basta para respondê-lo (senão None).
+        """
+        if self.tt is None:
+            return 0, 0, None, alpha, beta, None
+        tt_key, tt_sym = self._tt_key(game)
+        entry = self.tt.probe(tt_key)
+        if entry is None:
+            self.tt_misses += 1
+            return tt_key, tt_sym, None, alpha, beta, None
+        if entry[0] != tt_key:
+            self.tt_collisions += 1
+            return tt_key, tt_sym, None, alpha, beta, None
+        self.tt_hits += 1
+        _, entry_depth, entry_value, entry_flag, entry_move = entry
+        if tt_sym and entry_move is not None:
+            entry_move = transform_move(entry_move, INVERSE_SYMMETRY[tt_sym], game.geometry)
+        cutoff = None
+        if entry_depth >= depth:
+            if entry_flag == TranspositionTable.EXACT:
+                if self._pv is not None and entry_move is not None:
+                    self._pv[self._root_depth - depth] = [entry_move]
+                cutoff = entry_value, entry_move
+            else:
+                if entry_flag == TranspositionTable.LOWER:
+                    alpha = max(alpha, entry_value)
+                else:
+                    beta = min(beta, entry_value)
+                if beta <= alpha:
+                    cutoff = entry_value, entry_move
+        return tt_key, tt_sym, entry_move, alpha, beta, cutoff
+    
+    def _store_tt(self, game: TicTacToe5x5, tt_key: int, tt_sym: int, depth: int,
+                  best_eval: float, best_move: Optional[Tuple[int, int]],
+                  alpha_orig: float, beta_orig: float):
+        """Guarda o resultado do nó com o tipo de limite dado pela janela original"""
+        if self.tt is None:
+            return
+        if best_eval <= alpha_orig:
+            flag = TranspositionTable.UPPER
+        elif best_eval >= beta_orig:
+            flag = TranspositionTable.LOWER
+        else:
+            flag = TranspositionTable.EXACT
+        stored_move = transform_move(best_move, tt_sym, game.geometry) if tt_sym else best_move
+        self.tt.store(tt_key, depth, best_eval, flag, stored_move)
+    
+    def _prepare_moves(self, game: TicTacToe5x5, depth: int,
+                       tt_move: Optional[Tuple[int, int]], player: str):
+        """Jogadas do nó interno na ordem de busca e, no horizonte, seus valores
+        
+        Devolve (jogadas, valores), com valores do ponto de vista de player
+        quando os filhos são avaliados em lote (batch_eval), senão None.
+        """
+        ply = self._root_depth - depth
+        stats = self._stats
+        if stats is not None:
+            stats.interior_nodes += 1
+            start = time.perf_counter_ns()
+        moves = game.get_available_moves()
+        if self.move_ordering:
+            moves = self._order_moves(game, moves, ply, tt_move)
+        if ply == 0 and self.use_symmetry:
+            moves = unique_moves(game, moves)
+        if stats is not None:
+            stats.movegen_ns += time.perf_counter_ns() - start
+        
+        # Segue a variação principal da iteração anterior: jogada da PV primeiro
+        pv = self._pv
+        if pv is not None and ply < len(self._previous_pv):
+            pv_move = self._previous_pv[ply]
+            if (pv_move in moves and
+                    game.move_history[self._root_history_len:] == self._previous_pv[:ply]):
+                moves = [pv_move] + [m for m in moves if m != pv_move]
+        
+        # No horizonte, todos os filhos podem ser avaliados de uma vez
+        child_values = None
+        if (depth == 1 and self._score_children is not None and self.tablebase is None
+                and game.geometry is DEFAULT_GEOMETRY):
+            child_values = self._score_children(game, moves, player)
+            if pv is not None:
+                pv[ply + 1] = []
+        return moves, child_values
+    
+    def _batched_child(self, child_values: List[int], index: int, ply: int) -> int:
+        """Conta como visitado um filho avaliado em lote e devolve seu valor"""
+        self.nodes_visited += 1
+        if self._stats is not None:
+            self._stats.nodes_per_ply[ply + 1] += 1
+        return child_values[index]
+    
+    def _tt_key(self, game: TicTacToe5x5) -> Tuple[int, int]:
+        """Chave da tabela de transposição e simetria aplicada (0 sem simetria)"""
+        if self.use_symmetry:
+            return game.canonical_hash()
+        return game.zobrist_hash, 0
+    
+    def _order_moves(self, game: TicTacToe5x5, moves: List[Tuple[int, int]], ply: int,
+                     tt_move: Optional[Tuple[int, int]]) -> List[Tuple[int, int]]:
+        """Ordena as jogadas segundo as heurísticas habilitadas em move_ordering"""
+        ordering = self.move_ordering
+        if 'history' in ordering:
+            history = self._history[game.current_player]
+            if 'center' in ordering:
+                center_rank = game.geometry.center_rank
+                moves = sorted(moves, key=lambda m: (-history[m[0]][m[1]], center_rank[m[0]][m[1]]))
+            else:
+                moves = sorted(moves, key=lambda m: -history[m[0]][m[1]])
+        elif 'center' in ordering:
+            center_rank = game.geometry.center_rank
+            moves = sorted(moves, key=lambda m: center_rank[m[0]][m[1]])
+        
+        # Jogadas da tabela de transposição e killers vão para a frente
+        front = []
+        if 'tt' in ordering and tt_move is not None and tt_move in moves:
+            front.append(tt_move)
+        if 'killers' in ordering:
+            for killer in self._killers[ply]:
+                if killer is not None and killer not in front and killer in moves:
+                    front.append(killer)
+        if front:
+            moves = front + [m for m in moves if m not in front]
+        return moves
+    
+    def _record_cutoff(self, game: TicTacToe5x5, move: Tuple[int, int], ply: int,
+                       depth: int, index: int):
+        """Conta a poda e atualiza killers e histórico com a jogada que a causou"""
+        self.pruned_branches += 1
+        if self._stats is not None:
+            self._stats.record_cutoff(index)
+        if 'killers' in self.move_ordering:
+            killers = self._killers[ply]
+            if killers[0] != move:
+                killers[1] = killers[0]
+                killers[0] = move
+        if 'history' in self.move_ordering:
+            self._history[game.current_player][move[0]][move[1]] += depth * depth
+    
+    def _reset_move_ordering(self, age_history: bool = True, size: int = 5):
+        """Prepara as tabelas de ordenação para uma nova jogada num tabuleiro size x size"""
+        self._killers = [[None, None] for _ in range(self.max_depth + 1)]
+        if len(self._history['X']) != size:
+            # Outro tamanho de tabuleiro: o histórico anterior não se aplica
+            self._history = {p: [[0] * size for _ in range(size)] for p in ('X', 'O')}
+            return
+        if not age_history:
+            return
+        # O histórico é mantido entre jogadas, mas envelhecido
+        for table in self._history.values():
+            for row in table:
+                for c in range(size):
+                    row[c] //= 2
+    
+    def get_best_move(self, game: TicTacToe5x5,
+                      time_limit: Optional[float] = None) -> Tuple[int, int]:
+        """Retorna a melhor jogada
+        
+        time_limit (segundos) sobrepõe o limite de tempo do agente para esta jogada.
+        """
+        if not self.collect_stats:
+            return self._choose_move(game, time_limit)
+        
+        stats = SearchStats(self.player, self.max_depth)
+        cache = self.eval_cache
+        cache_hits, cache_misses = (cache.hits, cache.misses) if cache is not None else (0, 0)
+        self._stats = stats
+        start = time.perf_counter_ns()
+        try:
+            move = self._choose_move(game, time_limit)
+        finally:
+            self._stats = None
+        stats.elapsed_ns = time.perf_counter_ns() - start
+        stats.move = move
+        self._finish_stats(stats)
+        if cache is not None:
+            stats.cache_hits = cache.hits - cache_hits
+            stats.cache_misses = cache.misses - cache_misses
+        self.last_stats = stats
+        for hook in self.stats_hooks:
+            hook(stats)
+        return move
+    
+    def _finish_stats(self, stats: SearchStats):
+        """Copia os contadores do agente para as estatísticas da jogada"""
+        stats.value = self.best_value
+        stats.depth = self.completed_depth
+        stats.nodes = self.nodes_visited
+        stats.tt_hits = self.tt_hits
+        stats.tt_misses = self.tt_misses
+    
+    def _choose_move(self, game: TicTacToe5x5,
+                     time_limit: Optional[float]) -> Tuple[int, int]:
+        """Livro, tabela de finais, busca de ameaças ou busca completa"""
         self.nodes_visited = 0
         self.pruned_branches = 0
+        # Só o livro e a busca definem uma profundidade; a tabela de finais e a
+        # busca de ameaças não fazem busca completa
+        self.completed_depth = 0
+        self.tt_hits = 0
+        self.tt_misses = 0
+        self.tt_collisions = 0
+        self._tablebase_lookup_only = False
         is_maximizing = (game.current_player == self.player)
-        _, move = self.alpha_beta(game, self.max_depth, float('-inf'), 
-                                   float('inf'), is_maximizing)
+        if self.opening_book is not None:
+            found = self.opening_book.lookup(game)
+            if found is not None:
+                move, value = found
+                self.best_value = value if is_maximizing else -value
+                self.completed_depth = self.opening_book.depth
+                return move
+        if time_limit is None:
+            time_limit = self.time_limit
+        if self.tablebase is not None and self.tablebase.covers(game):
+            deadline = time.perf_counter() + time_limit if time_limit is not None else None
+            position = game.copy()
+            try:
+                value = self.tablebase.value(position, self.player, deadline)
+                move = self.tablebase.best_move(position, deadline)
+            except _SearchTimeout:
+                # Final grande demais para o prazo: busca com o tempo que sobrou,
+                # sem tentar resolver de novo o que acabou de estourar o prazo
+                time_limit = max(deadline - time.perf_counter(), 0.0)
+                self._tablebase_lookup_only = True
+            else:
+                self.best_value = value * WIN_SCORE
+                return move
+        threat_move = _threat_move(self._threat_search, game)
+        if self._threat_search is not None:
+            self.nodes_visited += self._threat_search.nodes_visited
+        if threat_move is not None:
+            self.best_value = WIN_SCORE if is_maximizing else -WIN_SCORE
+            return threat_move
+        
+        self._reset_move_ordering(size=game.size)
+        if time_limit is not None:
+            return self._iterative_deepening(game.copy(), is_maximizing, time_limit)
+        
+        self.completed_depth = self.max_depth
+        self._root_depth = self.max_depth
+        if self.workers > 1 and self.max_depth > 1 and not game.is_terminal():
+            return self._parallel_root_search(game.copy(), is_maximizing)
+        self.best_value, move = self._search_root(game.copy(), self.max_depth, is_maximizing)
         return move
+    
+    def _search_root(self, game: TicTacToe5x5, depth: int, is_maximizing: bool,
+                     guess: Optional[float] = None) -> Tuple[int, Optional[Tuple[int, int]]]:
+        """Busca da raiz com janela completa; guess é o valor da iteração anterior"""
+        return self.alpha_beta(game, depth, float('-inf'), float('inf'), is_maximizing)
+    
+    def _search_settings(self) -> tuple:
+        """Parâmetros que os processos auxiliares usam para recriar o agente"""
+        tt_size = self.tt.size if self.tt is not None else 0
+        tt_replacement = self.tt.replacement if self.tt is not None else 'depth'
+        return (self.max_depth, tt_size, tt_replacement, self.move_ordering,
+                self.use_symmetry, self.batch_eval)
+    
+    def _parallel_root_search(self, game: TicTacToe5x5,
+                              is_maximizing: bool) -> Tuple[int, int]:
+        """Divide as jogadas da raiz entre processos (Young Brothers Wait)"""
+        self.nodes_visited += 1
+        stats = self._stats
+        if stats is not None:
+            stats.nodes_per_ply[0] += 1
+            stats.interior_nodes += 1
+        tt_move = None
+        if self.tt is not None:
+            tt_key, tt_sym = self._tt_key(game)
+            entry = self.tt.probe(tt_key)
+            if entry is not None and entry[0] == tt_key and entry[4] is not None:
+                tt_move = transform_move(entry[4], INVERSE_SYMMETRY[tt_sym], game.geometry)
+        moves = game.get_available_moves()
+        if self.move_ordering:
+            moves = self._order_moves(game, moves, 0, tt_move)
+        if self.use_symmetry:
+            moves = unique_moves(game, moves)
+        
+        # Irmão mais velho: primeira jogada com janela completa, no próprio processo
+        first = moves[0]
+        game.make_move(first[0], first[1])
+        first_eval, _ = self.alpha_beta(game, self.max_depth - 1, float('-inf'),
+                                        float('inf'), not is_maximizing)
+        game.undo_move()
+        
+        # Irmãos mais novos em paralelo, já com o limite da primeira jogada
+        alpha, beta = ((first_eval, float('inf')) if is_maximizing
+                       else (float('-inf'), first_eval))
+        if self._pool is None:
+            # A tabela de finais vai uma vez para cada processo, não a cada tarefa
+            self._pool = ProcessPoolExecutor(max_workers=self.workers,
+                                             initializer=_init_search_worker,
+                                             initargs=(self.tablebase,))
+        settings = self._search_settings()
+        history = list(game.move_history)
+        futures = [self._pool.submit(_search_root_move, type(game), history, move,
+                                     self.player, alpha, beta, is_maximizing, settings,
+                                     type(self), (game.size, game.k), stats is not None)
+                   for move in moves[1:]]
+        
+        # Mesma regra da busca serial: primeira jogada estritamente melhor, na ordem
+        best_eval, best_move = first_eval, first
+        for move, future in zip(moves[1:], futures):
+            eval_score, nodes, pruned, hits, misses, collisions, worker_stats = future.result()
+            if worker_stats is not None:
+                self._merge_worker_stats(worker_stats)
+            self.nodes_visited += nodes
+            self.pruned_branches += pruned
+            self.tt_hits += hits
+            self.tt_misses += misses
+            self.tt_collisions += collisions
+            if (eval_score > best_eval) if is_maximizing else (eval_score < best_eval):
+                best_eval, best_move = eval_score, move
+        
+        if self.tt is not None:
+            self.tt.store(tt_key, self.max_depth, best_eval,
+                          TranspositionTable.EXACT, transform_move(best_move, tt_sym, game.geometry))
+        self.best_value = best_eval
+        return best_move
+    
+    def _merge_worker_stats(self, worker_stats: SearchStats):
+        """Acrescenta às estatísticas da jogada as de uma subárvore da busca paralela"""
+        self._stats.merge(worker_stats)
+    
+    def close(self):
+        """Encerra o pool de processos da busca paralela, se houver"""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+    
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_pool'] = None
+        return state
+    
+    def _iterative_deepening(self, game: TicTacToe5x5, is_maximizing: bool,
+                             time_limit: float) -> Tuple[int, int]:
+        """Aprofundamento iterativo com orçamento de tempo por jogada"""
+        moves = game.get_available_moves()
+        best_move = None
+        self.best_value = None
+        self.completed_depth = 0
+        deadline = time.perf_counter() + time_limit
+        lookup_only = self._tablebase_lookup_only
+        self._next_time_check = self.nodes_visited
+        self._root_history_len = len(game.move_history)
+        self._previous_pv = []
+        try:
+            # Além do número de casas vazias, iterações mais profundas são idênticas
+            for depth in range(1, min(self.max_depth, len(moves)) + 1):
+                # A profundidade 1 nunca é interrompida (nem resolve finais), para
+                # que a jogada devolvida tenha sempre sido avaliada
+                self._deadline = deadline if depth > 1 else None
+                self._tablebase_lookup_only = lookup_only or depth == 1
+                self._root_depth = depth
+                self._pv = [[] for _ in range(depth + 1)]
+                guess = self.best_value if self.completed_depth > 0 else None
+                value, move = self._search_root(game, depth, is_maximizing, guess)
+                best_move = move
+                self.best_value = value
+                self.completed_depth = depth
+                self._previous_pv = self._pv[0]
+        except _SearchTimeout:
+            pass
+        finally:
+            self._deadline = None
+            self._tablebase_lookup_only = lookup_only
+            self._pv = None
+        return best_move
 
 
-def simulate_game(agent1, agent2, verbose=False):
-    """Simula uma partida entre dois agentes"""
-    game = TicTacToe5x5()
+# Agentes reaproveitados por processo auxiliar, para manter a tabela de
+# transposição e o histórico entre as tarefas da busca paralela
+_worker_agents = {}
+# Tabela de finais do agente dono do pool (ver _init_search_worker)
+_worker_tablebase = None
+
+
+def _init_search_worker(tablebase):
+    """Inicializa um processo auxiliar da busca paralela com a tabela de finais do agente"""
+    global _worker_tablebase
+    _worker_tablebase = tablebase
+
+
+def _search_root_move(game_class, history, move, player, alpha, beta,
+                      is_maximizing, settings, agent_class=None, dimensions=(5, 4),
+                      collect_stats=False):
+    """Busca a subárvore de uma jogada da raiz em um processo auxiliar
+    
+    dimensions é o (size, k) do tabuleiro passado a game_class. Com
+    collect_stats=True também retorna as SearchStats da subárvore (senão None).
+    """
+    if agent_class is None:
+        agent_class = AlphaBetaAgent
+    max_depth, tt_size, tt_replacement, move_ordering, use_symmetry, batch_eval = settings
+    key = (agent_class, player) + settings
+    agent = _worker_agents.get(key)
+    if agent is None:
+        agent = agent_class(player, max_depth, tt_size=tt_size,
+                            tt_replacement=tt_replacement, move_ordering=move_ordering,
+                            use_symmetry=use_symmetry, batch_eval=batch_eval,
+                            tablebase=_worker_tablebase)
+        _worker_agents[key] = agent
+    agent.nodes_visited = 0
+    agent.pruned_branches = 0
+    agent.tt_hits = 0
+    agent.tt_misses = 0
+    agent.tt_collisions = 0
+    if isinstance(agent, PVSAgent):
+        agent.re_searches = 0
+    agent._reset_move_ordering(age_history=False, size=dimensions[0])
+    agent._root_depth = max_depth
+    stats = SearchStats(player, max_depth) if collect_stats else None
+    
+    game = game_class(*dimensions)
+    for r, c in history:
+        game.make_move(r, c)
+    game.make_move(move[0], move[1])
+    agent._stats = stats
+    try:
+        eval_score, _ = agent.alpha_beta(game, max_depth - 1, alpha, beta, not is_maximizing)
+    finally:
+        agent._stats = None
+    if stats is not None:
+        agent._finish_stats(stats)
+    return (eval_score, agent.nodes_visited, agent.pruned_branches,
+            agent.tt_hits, agent.tt_misses, agent.tt_collisions, stats)
+
+
+class PVSAgent(AlphaBetaAgent):
+    """Agente usando Principal Variation Search (NegaScout) em forma negamax
+    
+    A primeira jogada de cada nó é buscada com a janela completa e as demais
+    com janela nula; só quando uma delas fica dentro da janela é feita uma
+    nova busca completa (contada em re_searches). No aprofundamento iterativo
+    (time_limit) a raiz usa uma janela de aspiração de ±aspiration_window em
+    torno do valor da iteração anterior, repetida com janela completa quando
+    o valor cai fora dela (contado em aspiration_failures).
+    
+    Aceita as mesmas opções do AlphaBetaAgent. Os valores na tabela de
+    transposição ficam do ponto de vista do jogador da vez.
+    """
+    
+    def __init__(self, player: str, max_depth: int = 4, aspiration_window: int = 500,
+                 **kwargs):
+        super().__init__(player, max_depth, **kwargs)
+        self.aspiration_window = aspiration_window
+        self.re_searches = 0
+        self.aspiration_failures = 0
+    
+    def _choose_move(self, game: TicTacToe5x5,
+                     time_limit: Optional[float]) -> Tuple[int, int]:
+        self.re_searches = 0
+        self.aspiration_failures = 0
+        return super()._choose_move(game, time_limit)
+    
+    def _finish_stats(self, stats: SearchStats):
+        super()._finish_stats(stats)
+        stats.re_searches = self.re_searches
+        stats.aspiration_failures = self.aspiration_failures
+    
+    def _merge_worker_stats(self, worker_stats: SearchStats):
+        super()._merge_worker_stats(worker_stats)
+        self.re_searches += worker_stats.re_searches
+    
+    def alpha_beta(self, game: TicTacToe5x5, depth: int, alpha: float,
+                   beta: float, is_maximizing: bool) -> Tuple[int, Optional[Tuple[int, int]]]:
+        """Mesma interface do AlphaBetaAgent (valores do ponto de vista do agente)"""
+        if is_maximizing:
+            return self.negamax(game, depth, alpha, beta)
+        value, move = self.negamax(game, depth, -beta, -alpha)
+        return -value, move
+    
+    def _search_root(self, game: TicTacToe5x5, depth: int, is_maximizing: bool,
+                     guess: Optional[float] = None) -> Tuple[int, Optional[Tuple[int, int]]]:
+        """Busca da raiz com janela de aspiração em torno de guess"""
+        if guess is None or abs(guess) >= WIN_SCORE:
+            return super()._search_root(game, depth, is_maximizing)
+        alpha, beta = guess - self.aspiration_window, guess + self.aspiration_window
+        value, move = self.alpha_beta(game, depth, alpha, beta, is_maximizing)
+        if alpha < value < beta:
+            return value, move
+        self.aspiration_failures += 1
+        return super()._search_root(game, depth, is_maximizing)
+    
+    def negamax(self, game: TicTacToe5x5, depth: int, alpha: float,
+                beta: float) -> Tuple[int, Optional[Tuple[int, int]]]:
+        """PVS em forma negamax: valores do ponto de vista do jogador da vez"""
+        to_move = game.current_player
+        value = self._enter_node(game, depth, to_move)
+        if value is not None:
+            return value, None
+        
+        ply = self._root_depth - depth
+        alpha_orig, beta_orig = alpha, beta
+        tt_key, tt_sym, tt_move, alpha, beta, cutoff = self._probe_tt(game, depth, alpha, beta)
+        if cutoff is not None:
+            return cutoff
+        moves, child_values = self._prepare_moves(game, depth, tt_move, to_move)
+        pv = self._pv
+        best_eval = float('-inf')
+        best_move = None
+        
+        for i, move in enumerate(moves):
+            if child_values is not None:
+                eval_score = self._batched_child(child_values, i, ply)
+            else:
+                game.make_move(move[0], move[1])
+                if i == 0:
+                    eval_score = -self.negamax(game, depth - 1, -beta, -alpha)[0]
+                else:
+                    # Janela nula: só prova que a jogada não supera alpha
+                    eval_score = -self.negamax(game, depth - 1, -alpha - 1, -alpha)[0]
+                    if alpha < eval_score < beta:
+                        self.re_searches += 1
+                        eval_score = -self.negamax(game, depth - 1, -beta, -eval_score)[0]
+                game.undo_move()
+            
+            if eval_score > best_eval:
+                best_eval = eval_score
+                best_move = move
+                if pv is not None:
+                    pv[ply] = [move] + pv[ply + 1]
+            
+            alpha = max(alpha, eval_score)
+            if beta <= alpha:
+                self._record_cutoff(game, move, ply, depth, i)
+                break
+        
+        self._store_tt(game, tt_key, tt_sym, depth, best_eval, best_move, alpha_orig, beta_orig)
+        return best_eval, best_move
+
+class _MCTSNode:
+    """Nó da árvore do MCTS (com __slots__ para economizar memória)
+    
+    wins acumula o resultado das simulações do ponto de vista de player, o
+    jogador que fez move (vitória = 1, empate = 0.5).
+    """
+    
+    __slots__ = ('move', 'player', 'parent', 'children', 'untried', 'visits', 'wins')
+    
+    def __init__(self, move: Optional[Tuple[int, int]], player: Optional[str],
+                 parent: Optional['_MCTSNode'], untried: List[Tuple[int, int]]):
+        self.move = move
+        self.player = player
+        self.parent = parent
+        self.children: List['_MCTSNode'] = []
+        self.untried = untried
+        self.visits = 0
+        self.wins = 0.0
+
+
+class MCTSAgent:
+    """Agente usando Monte Carlo Tree Search (UCT)
+    
+    A cada jogada roda playouts simulações (ou até time_limit segundos, o que
+    acabar primeiro): seleção pelo UCT com constante exploration, expansão de
+    um filho, partida aleatória até o fim e retropropagação do resultado. A
+    jogada escolhida é a do filho da raiz mais visitado.
+    
+    Com reuse_tree=True a subárvore da posição atual é mantida entre as
+    jogadas do agente. Com rollout_batch > 1 (requer NumPy), cada simulação
+    completa rollout_batch partidas aleatórias de uma vez
+    (vectorized.random_rollouts).
+    
+    nodes_visited conta os nós da árvore percorridos na última jogada.
+    """
+    
+    def __init__(self, player: str, playouts: Optional[int] = 1000,
+                 time_limit: Optional[float] = None, exploration: float = 1.4,
+                 rollout_batch: int = 1, reuse_tree: bool = True):
+        if playouts is None and time_limit is None:
+            raise ValueError("MCTSAgent precisa de playouts ou time_limit")
+        self.player = player
+        self.opponent = 'O' if player == 'X' else 'X'
+        self.playouts = playouts
+        self.time_limit = time_limit
+        self.exploration = exploration
+        self.rollout_batch = rollout_batch
+        self.reuse_tree = reuse_tree
+        # Semente derivada do gerador global: partidas semeadas são reproduzíveis
+        self._rng = random.Random(random.getrandbits(64))
+        self._random_rollouts = None
+        self._np_rng = None
+        if rollout_batch > 1:
+            import numpy as np
+            from vectorized import random_rollouts
+            self._random_rollouts = random_rollouts
+            self._np_rng = np.random.default_rng(self._rng.getrandbits(64))
+        self.nodes_visited = 0
+        self.playouts_done = 0
+        self._root: Optional[_MCTSNode] = None
+        self._root_history: List[Tuple[int, int]] = []
+    
+    def _new_node(self, game: TicTacToe5x5, move: Optional[Tuple[int, int]],
+                  player: Optional[str], parent: Optional[_MCTSNode]) -> _MCTSNode:
+        """Cria um nó com as jogadas ainda não expandidas em ordem aleatória"""
+        untried = [] if game.is_terminal() else game.get_available_moves()
+        self._rng.shuffle(untried)
+        return _MCTSNode(move, player, parent, untried)
+    
+    def _reuse_root(self, game: TicTacToe5x5) -> Optional[_MCTSNode]:
+        """Subárvore da posição atual, se ela já estiver na árvore anterior"""
+        node = self._root
+        history = game.move_history
+        start = len(self._root_history)
+        if node is None or history[:start] != self._root_history:
+            return None
+        for move in history[start:]:
+            node = next((child for child in node.children if child.move == move), None)
+            if node is None:
+                return None
+        node.parent = None
+        return node
+    
+    def _select_child(self, node: _MCTSNode) -> _MCTSNode:
+        """Filho com maior valor UCT"""
+        log_visits = math.log(node.visits)
+        exploration = self.exploration
+        best, best_value = None, float('-inf')
+        for child in node.children:
+            value = (child.wins / child.visits
+                     + exploration * math.sqrt(log_visits / child.visits))
+            if value > best_value:
+                best, best_value = child, value
+        return best
+    
+    def _rollout(self, game: TicTacToe5x5) -> Tuple[float, float, int]:
+        """Pontos de X, pontos de O e número de partidas aleatórias simuladas"""
+        if self._random_rollouts is not None:
+            winners = self._random_rollouts(game, self.rollout_batch, self._np_rng)
+            x_wins = int((winners == 1).sum())
+            o_wins = int((winners == -1).sum())
+            draws = len(winners) - x_wins - o_wins
+            return x_wins + 0.5 * draws, o_wins + 0.5 * draws, len(winners)
+        
+        played = 0
+        while not game.is_terminal():
+            moves = game.get_available_moves()
+            move = moves[self._rng.randrange(len(moves))]
+            game.make_move(move[0], move[1])
+            played += 1
+        winner = game.winner
+        for _ in range(played):
+            game.undo_move()
+        if winner is None:
+            return 0.5, 0.5, 1
+        return (1.0, 0.0, 1) if winner == 'X' else (0.0, 1.0, 1)
+    
+    def _playout(self, game: TicTacToe5x5, root: _MCTSNode):
+        """Uma iteração: seleção, expansão, simulação e retropropagação"""
+        node = root
+        depth = 0
+        while not node.untried and node.children:
+            node = self._select_child(node)
+            game.make_move(node.move[0], node.move[1])
+            depth += 1
+        if node.untried:
+            move = node.untried.pop()
+            player = game.current_player
+            game.make_move(move[0], move[1])
+            depth += 1
+            child = self._new_node(game, move, player, node)
+            node.children.append(child)
+            node = child
+        self.nodes_visited += depth + 1
+        
+        x_score, o_score, count = self._rollout(game)
+        for _ in range(depth):
+            game.undo_move()
+        
+        while node is not None:
+            node.visits += count
+            if node.player == 'X':
+                node.wins += x_score
+            elif node.player == 'O':
+                node.wins += o_score
+            node = node.parent
+    
+    def get_best_move(self, game: TicTacToe5x5,
+                      time_limit: Optional[float] = None) -> Tuple[int, int]:
+        """Retorna a jogada do filho da raiz mais visitado
+        
+        time_limit (segundos) sobrepõe o limite de tempo do agente para esta jogada.
+        """
+        self.nodes_visited = 0
+        self.playouts_done = 0
+        if time_limit is None:
+            time_limit = self.time_limit
+        deadline = time.perf_counter() + time_limit if time_limit is not None else None
+        
+        search_game = game.copy()
+        root = self._reuse_root(game) if self.reuse_tree else None
+        if root is None:
+            root = self._new_node(search_game, None, None, None)
+        
+        while self.playouts is None or self.playouts_done < self.playouts:
+            if deadline is not None and self.playouts_done > 0 and time.perf_counter() >= deadline:
+                break
+            self._playout(search_game, root)
+            self.playouts_done += 1
+        
+        best = max(root.children, key=lambda child: child.visits)
+        if self.reuse_tree:
+            self._root = best
+            self._root_history = game.move_history + [best.move]
+        return best.move
+
+
+def simulate_game(agent1, agent2, verbose=False, game_class=TicTacToe5x5, on_move=None,
+                  size=5, k=4):
+    """Simula uma partida entre dois agentes
+    
+    game_class permite escolher o backend do tabuleiro (ex.: BitboardTicTacToe5x5),
+    criado com game_class(size, k) (ex.: size=7, k=5 para 7x7 com 5 em linha).
+    on_move, se dado, recebe um registro por jogada (jogador, linha, coluna,
+    tempo e nós visitados).
+    """
+    game = game_class(size, k)
     agents = {'X': agent1, 'O': agent2}
     
     move_count = 0
@@ -320,12 +1867,15 @@ def simulate_game(agent1, agent2, verbose=False):
     while not game.is_terminal():
         current_agent = agents[game.current_player]
         
-        start_time = time.time()
+        start_time = time.perf_counter()
         move = current_agent.get_best_move(game)
-        elapsed_time = time.time() - start_time
+        elapsed_time = time.perf_counter() - start_time
         
         total_time[game.current_player] += elapsed_time
         total_nodes[game.current_player] += current_agent.nodes_visited
+        if on_move is not None:
+            on_move({'player': game.current_player, 'row': move[0], 'col': move[1],
+                     'time': elapsed_time, 'nodes': current_agent.nodes_visited})
         
         if verbose:
             print(f"\nJogador {game.current_player} - Jogada: {move}")
@@ -351,45 +1901,169 @@ def simulate_game(agent1, agent2, verbose=False):
     return results
 
 
-def run_experiments(num_games=10, depth=4):
-    """Executa múltiplas partidas e coleta estatísticas"""
+# Playouts por jogada do MCTS nos experimentos (a profundidade vale só para os outros agentes)
+MCTS_EXPERIMENT_PLAYOUTS = 1000
+
+
+def mcts_experiment_agent(player, depth):
+    """Cria o MCTSAgent dos experimentos; depth é ignorado"""
+    return MCTSAgent(player, playouts=MCTS_EXPERIMENT_PLAYOUTS)
+
+
+# Configurações de partida: nome -> (descrição, fábrica do agente X, fábrica do agente O);
+# as fábricas recebem (jogador, profundidade)
+EXPERIMENT_MATCHUPS = {
+    'minimax_vs_alphabeta': ('Minimax (X) vs Alpha-Beta (O)', MinimaxAgent, AlphaBetaAgent),
+    'alphabeta_vs_minimax': ('Alpha-Beta (X) vs Minimax (O)', AlphaBetaAgent, MinimaxAgent),
+    'mcts_vs_alphabeta': ('MCTS (X) vs Alpha-Beta (O)', mcts_experiment_agent, AlphaBetaAgent),
+    'alphabeta_vs_mcts': ('Alpha-Beta (X) vs MCTS (O)', AlphaBetaAgent, mcts_experiment_agent),
+}
+
+# Configurações jogadas por padrão em run_experiments
+DEFAULT_MATCHUPS = ('minimax_vs_alphabeta', 'alphabeta_vs_minimax')
+
+
+def _play_experiment_game(config, index, depth, seed, eval_cache_size=0, log_moves=False,
+                          size=5, k=4):
+    """Joga uma partida do experimento (executável em um processo auxiliar)"""
+    # Semente determinística por partida, independente do processo que a executa
+    random.seed(f"{seed}:{config}:{index}")
+    _, x_class, o_class = EXPERIMENT_MATCHUPS[config]
+    agent_x, agent_o = x_class('X', depth), o_class('O', depth)
+    if eval_cache_size > 0:
+        cache = shared_evaluation_cache(eval_cache_size)
+        for agent in (agent_x, agent_o):
+            if hasattr(agent, 'eval_cache'):
+                agent.eval_cache = cache
+    move_records = [] if log_moves else None
+    result = simulate_game(agent_x, agent_o, verbose=False,
+                           on_move=move_records.append if log_moves else None, size=size, k=k)
+    return config, index, result, move_records
+
+
+def _load_checkpoint(filename, depth, seed, keep_results=True, size=5, k=4):
+    """Lê as partidas já concluídas de um checkpoint JSON Lines (sem o log por jogada)
+    
+    Com keep_results=False só as chaves (configuração, índice) são guardadas.
+    Registros sem tamanho de tabuleiro são do 5x5 com 4 em linha.
+    """
+    done = {}
+    try:
+        with open(filename, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # linha truncada por uma interrupção
+                if (record['depth'] == depth and record['seed'] == seed
+                        and record.get('size', 5) == size and record.get('k', 4) == k):
+                    done[(record['config'], record['index'])] = (
+                        record['result'] if keep_results else None)
+    except FileNotFoundError:
+        pass
+    return done
+
+
+def _open_checkpoint(filename):
+    """Abre o checkpoint para acréscimo, isolando uma última linha truncada"""
+    truncated = False
+    try:
+        with open(filename, 'rb') as f:
+            f.seek(0, 2)
+            if f.tell() > 0:
+                f.seek(-1, 2)
+                truncated = f.read(1) != b"\n"
+    except FileNotFoundError:
+        pass
+    log = open(filename, 'a', encoding='utf-8')
+    if truncated:
+        log.write("\n")
+    return log
+
+
+def run_experiments(num_games=10, depth=4, workers=1, seed=0, checkpoint=None,
+                    matchups=DEFAULT_MATCHUPS, eval_cache_size=0, log_moves=False,
+                    keep_results=True, size=5, k=4):
+    """Executa múltiplas partidas e coleta estatísticas
+    
+    Com workers > 1 as partidas são distribuídas em um pool de processos; os
+    resultados voltam na ordem das partidas, independentemente da ordem de
+    término. Com checkpoint (arquivo JSON Lines) cada partida concluída é
+    gravada na hora, e as partidas já gravadas são reaproveitadas, de modo
+    que uma execução interrompida pode ser retomada com os mesmos parâmetros.
+    
+    matchups escolhe as configurações de EXPERIMENT_MATCHUPS (por exemplo,
+    'mcts_vs_alphabeta' para comparar MCTS e Alfa-Beta). Com eval_cache_size > 0
+    os agentes de cada processo compartilham um EvaluationCache desse tamanho.
+    
+    O checkpoint é também o log de resultados: uma linha JSON compacta por
+    partida, acrescentada assim que ela termina; com log_moves=True a linha
+    inclui um registro por jogada ('move_log'). Com keep_results=False os
+    resultados não são acumulados em memória e a função retorna None; leia o
+    log com analysis_plots.iter_results_log.
+    
+    size e k escolhem o tabuleiro (ex.: size=6, k=4); os agentes usam as
+    tabelas geradas para essas dimensões.
+    """
+    for config in matchups:
+        if config not in EXPERIMENT_MATCHUPS:
+            raise ValueError(f"Configuração de partida desconhecida: {config}")
     print(f"\n{'='*60}")
-    print(f"EXPERIMENTO: {num_games} partidas com profundidade {depth}")
+    print(f"EXPERIMENTO: {num_games} partidas com profundidade {depth} "
+          f"({size}x{size}, {k} em linha)")
     print(f"{'='*60}\n")
     
-    results = {
-        'minimax_vs_alphabeta': [],
-        'alphabeta_vs_minimax': []
-    }
-    
-    # Minimax (X) vs Alpha-Beta (O)
-    print("Partidas: Minimax (X) vs Alpha-Beta (O)")
-    for i in range(num_games):
-        agent_minimax = MinimaxAgent('X', depth)
-        agent_alphabeta = AlphaBetaAgent('O', depth)
-        
-        result = simulate_game(agent_minimax, agent_alphabeta, verbose=False)
-        results['minimax_vs_alphabeta'].append(result)
-        print(f"Partida {i+1}: Vencedor = {result['winner']}, "
-              f"Jogadas = {result['moves']}, "
-              f"Tempo X = {result['time_X']:.3f}s, "
-              f"Tempo O = {result['time_O']:.3f}s")
+    if not keep_results and not checkpoint:
+        raise ValueError("keep_results=False requer um checkpoint para gravar os resultados")
+    results = {config: [None] * num_games for config in matchups} if keep_results else None
+    done = _load_checkpoint(checkpoint, depth, seed, keep_results, size, k) if checkpoint else {}
+    if keep_results:
+        for (config, index), result in done.items():
+            if config in results and index < num_games:
+                results[config][index] = result
+    if done:
+        print(f"Retomando: {len(done)} partidas já concluídas em {checkpoint}\n")
     
-    print("\n" + "-"*60 + "\n")
+    tasks = [(config, i) for config in matchups for i in range(num_games)
+             if (config, i) not in done]
+    done = None
+    log = _open_checkpoint(checkpoint) if checkpoint else None
     
-    # Alpha-Beta (X) vs Minimax (O)
-    print("Partidas: Alpha-Beta (X) vs Minimax (O)")
-    for i in range(num_games):
-        agent_alphabeta = AlphaBetaAgent('X', depth)
-        agent_minimax = MinimaxAgent('O', depth)
-        
-        result = simulate_game(agent_alphabeta, agent_minimax, verbose=False)
-        results['alphabeta_vs_minimax'].append(result)
-        print(f"Partida {i+1}: Vencedor = {result['winner']}, "
+    def finish(config, index, result, move_records):
+        if keep_results:
+            results[config][index] = result
+        if log is not None:
+            record = {'config': config, 'index': index, 'depth': depth,
+                      'seed': seed, 'size': size, 'k': k, 'result': result}
+            if move_records is not None:
+                record['move_log'] = move_records
+            log.write(json.dumps(record, separators=(',', ':')) + "\n")
+            log.flush()
+        print(f"[{EXPERIMENT_MATCHUPS[config][0]}] Partida {index+1}: "
+              f"Vencedor = {result['winner']}, "
               f"Jogadas = {result['moves']}, "
               f"Tempo X = {result['time_X']:.3f}s, "
               f"Tempo O = {result['time_O']:.3f}s")
     
+    try:
+        if workers > 1:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = [pool.submit(_play_experiment_game, config, i, depth, seed,
+                                       eval_cache_size, log_moves, size, k)
+                           for config, i in tasks]
+                for future in as_completed(futures):
+                    finish(*future.result())
+        else:
+            for config, i in tasks:
+                finish(*_play_experiment_game(config, i, depth, seed, eval_cache_size,
+                                              log_moves, size, k))
+    finally:
+        if log is not None:
+            log.close()
+    
     return results
 
 
@@ -0,0 +1,225 @@
+"""Avaliação vetorizada (NumPy) de lotes de posições do Jogo da Velha 5x5
+
+As posições são arrays int8 de 25 casas (índice linha*5 + coluna) com
+1 para X, -1 para O e 0 para casa vazia. Um lote é um array (N, 25).
+random_rollouts aceita qualquer tabuleiro N x N (arrays de N*N casas); as
+demais funções são do 5x5 com 4 em linha.
+"""
+
+import time
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from tictactoe_5x5 import (DEFAULT_GEOMETRY, DEFAULT_MATCHUPS, EXPERIMENT_MATCHUPS, WIN_SCORE,
+                           BoardGeometry, TicTacToe5x5, window_value)
+
+_WINDOW_INDICES: Dict[Tuple[int, int], np.ndarray] = {}
+
+
+def window_index(geometry: BoardGeometry) -> np.ndarray:
+    """Casas (índice linha*N + coluna) de cada janela da geometria: matriz (janelas, k)"""
+    index = _WINDOW_INDICES.get((geometry.size, geometry.k))
+    if index is None:
+        index = np.array([[r * geometry.size + c for r, c in line] for line in geometry.win_lines],
+                         dtype=np.intp)
+        _WINDOW_INDICES[(geometry.size, geometry.k)] = index
+    return index
+
+
+# Casas de cada uma das 28 janelas do 5x5: matriz (28, 4)
+WINDOW_INDEX = window_index(DEFAULT_GEOMETRY)
+
+# Pontuação de uma janela por (peças de X, peças de O), do ponto de vista de X
+WINDOW_VALUE_TABLE = np.array([[window_value(x, o) for o in range(5)] for x in range(5)],
+                              dtype=np.int64)
+
+PIECE_CODES = {' ': 0, 'X': 1, 'O': -1}
+
+
+def encode_game(game: TicTacToe5x5) -> np.ndarray:
+    """Converte um tabuleiro em um array (25,) int8"""
+    return np.array([PIECE_CODES[cell] for row in game.board for cell in row], dtype=np.int8)
+
+
+def encode_games(games: Sequence[TicTacToe5x5]) -> np.ndarray:
+    """Converte uma sequência de tabuleiros em um lote (N, 25) int8"""
+    return np.array([[PIECE_CODES[cell] for row in game.board for cell in row]
+                     for game in games], dtype=np.int8).reshape(len(games), 25)
+
+
+def window_counts(positions: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Peças de X e de O em cada janela: dois arrays (N, 28)"""
+    windows = positions[:, WINDOW_INDEX]
+    return (windows == 1).sum(axis=2), (windows == -1).sum(axis=2)
+
+
+def batch_heuristic(positions: np.ndarray, player: str = 'X') -> np.ndarray:
+    """Heurística das janelas (mesma de window_value) para cada posição do lote"""
+    x_counts, o_counts = window_counts(positions)
+    scores = WINDOW_VALUE_TABLE[x_counts, o_counts].sum(axis=1)
+    return scores if player == 'X' else -scores
+
+
+def batch_winner(positions: np.ndarray) -> np.ndarray:
+    """Vencedor de cada posição do lote: 1 (X), -1 (O) ou 0 (nenhum)"""
+    x_counts, o_counts = window_counts(positions)
+    return ((x_counts == 4).any(axis=1).astype(np.int8)
+            - (o_counts == 4).any(axis=1).astype(np.int8))
+
+
+def score_children(game: TicTacToe5x5, moves: List[Tuple[int, int]], player: str) -> List[int]:
+    """Valores, do ponto de vista de player, das posições filhas no horizonte de busca
+
+    Gera todos os filhos de uma vez e aplica a mesma regra da busca: vitória
+    vale WIN_SCORE, tabuleiro cheio vale 0 e os demais recebem a heurística.
+    A posição atual não pode ser terminal.
+    """
+    mover = game.current_player
+    cells = np.array([r * 5 + c for r, c in moves], dtype=np.intp)
+    children = np.repeat(encode_game(game)[np.newaxis, :], len(moves), axis=0)
+    children[np.arange(len(moves)), cells] = PIECE_CODES[mover]
+
+    x_counts, o_counts = window_counts(children)
+    scores = WINDOW_VALUE_TABLE[x_counts, o_counts].sum(axis=1)
+    if player == 'O':
+        scores = -scores
+    # Só quem acabou de jogar pode ter completado uma janela
+    mover_counts = x_counts if mover == 'X' else o_counts
+    wins = (mover_counts == 4).any(axis=1)
+    full = game.move_count + 1 == 25
+    scores = np.where(wins, WIN_SCORE if mover == player else -WIN_SCORE,
+                      0 if full else scores)
+    return scores.tolist()
+
+
+def random_empty_cells(positions: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    """Sorteia uma casa vazia (uniforme) em cada posição do lote"""
+    noise = rng.random(positions.shape)
+    noise[positions != 0] = -1.0
+    return noise.argmax(axis=1)
+
+
+def random_rollouts(game: TicTacToe5x5, count: int, rng: np.random.Generator) -> np.ndarray:
+    """Completa count partidas aleatórias a partir da posição, todas de uma vez
+
+    Retorna o vencedor de cada uma: 1 (X), -1 (O) ou 0 (empate). Usa as janelas
+    da geometria do jogo, então vale para qualquer N x N com K em linha.
+    """
+    winner = game.winner
+    if winner is not None:
+        return np.full(count, PIECE_CODES[winner], dtype=np.int8)
+    positions = np.repeat(encode_game(game)[np.newaxis, :], count, axis=0)
+    winners = np.zeros(count, dtype=np.int8)
+    code = PIECE_CODES[game.current_player]
+    active = np.arange(count)
+    index = window_index(game.geometry)
+    for _ in range(game.geometry.cells - game.move_count):
+        cells = random_empty_cells(positions[active], rng)
+        positions[active, cells] = code
+        windows = positions[active][:, index]
+        won = (windows == code).all(axis=2).any(axis=1)
+        winners[active[won]] = code
+        active = active[~won]
+        if len(active) == 0:
+            break
+        code = -code
+    return winners
+
+
+def _game_from_position(position: np.ndarray, game_class=TicTacToe5x5) -> TicTacToe5x5:
+    """Reconstrói um tabuleiro a partir de uma posição não terminal do lote
+
+    As peças são colocadas alternando X e O; como a posição não tem janela
+    completa, nenhuma ordem intermediária termina a partida.
+    """
+    game = game_class()
+    x_cells = np.flatnonzero(position == 1).tolist()
+    o_cells = np.flatnonzero(position == -1).tolist()
+    for i, cell in enumerate(x_cells):
+        game.make_move(*divmod(cell, 5))
+        if i < len(o_cells):
+            game.make_move(*divmod(o_cells[i], 5))
+    return game
+
+
+def simulate_games_batch(agent_x, agent_o, num_games: int, opening_moves: int = 0,
+                         seed: int = 0, game_class=TicTacToe5x5) -> List[dict]:
+    """Joga num_games partidas em paralelo, uma jogada de todas por vez
+
+    Os tabuleiros ficam em um único array (N, 25); as jogadas são aplicadas
+    ao lote inteiro e os vencedores detectados pelas janelas de uma só vez.
+    As opening_moves primeiras jogadas de cada partida são sorteadas (com
+    seed) para diversificar as partidas. A cada rodada os agentes só buscam
+    nas posições distintas do lote: partidas na mesma posição recebem a
+    mesma jogada, e o tempo e os nós dessa busca contam para cada uma delas.
+
+    Retorna um dicionário por partida no formato de simulate_game.
+    """
+    rng = np.random.default_rng(seed)
+    agents = {'X': agent_x, 'O': agent_o}
+    positions = np.zeros((num_games, 25), dtype=np.int8)
+    winners = np.zeros(num_games, dtype=np.int8)
+    moves = np.zeros(num_games, dtype=np.int64)
+    total_time = {'X': np.zeros(num_games), 'O': np.zeros(num_games)}
+    total_nodes = {'X': np.zeros(num_games, dtype=np.int64),
+                   'O': np.zeros(num_games, dtype=np.int64)}
+
+    for ply in range(25):
+        active = np.flatnonzero(winners == 0)
+        if len(active) == 0:
+            break
+        mover = 'X' if ply % 2 == 0 else 'O'
+
+        if ply < opening_moves:
+            cells = random_empty_cells(positions[active], rng)
+        else:
+            distinct, inverse = np.unique(positions[active], axis=0, return_inverse=True)
+            inverse = inverse.reshape(-1)
+            distinct_cells = np.empty(len(distinct), dtype=np.intp)
+            agent = agents[mover]
+            for i, position in enumerate(distinct):
+                game = _game_from_position(position, game_class)
+                start_time = time.perf_counter()
+                row, col = agent.get_best_move(game)
+                elapsed_time = time.perf_counter() - start_time
+                distinct_cells[i] = row * 5 + col
+                sharing = active[inverse == i]
+                total_time[mover][sharing] += elapsed_time
+                total_nodes[mover][sharing] += agent.nodes_visited
+            cells = distinct_cells[inverse]
+
+        positions[active, cells] = PIECE_CODES[mover]
+        moves[active] += 1
+        # Só o jogador que acabou de jogar pode ter completado uma janela
+        windows = positions[active][:, WINDOW_INDEX]
+        won = (windows == PIECE_CODES[mover]).all(axis=2).any(axis=1)
+        winners[active[won]] = PIECE_CODES[mover]
+
+    names = {1: 'X', -1: 'O', 0: 'Empate'}
+    return [{
+        'winner': names[int(winners[g])],
+        'moves': int(moves[g]),
+        'time_X': float(total_time['X'][g]),
+        'time_O': float(total_time['O'][g]),
+        'nodes_X': int(total_nodes['X'][g]),
+        'nodes_O': int(total_nodes['O'][g]),
+    } for g in range(num_games)]
+
+
+def run_batch_experiments(num_games: int = 100, depth: int = 4, opening_moves: int = 2,
+                          seed: int = 0, matchups=DEFAULT_MATCHUPS) -> dict:
+    """Versão em lote de run_experiments: mesmas configurações e mesmo formato de resultado"""
+    print(f"\n{'='*60}")
+    print(f"EXPERIMENTO EM LOTE: {num_games} partidas com profundidade {depth} "
+          f"({opening_moves} jogadas de abertura sorteadas)")
+    print(f"{'='*60}\n")
+
+    results = {}
+    for config in matchups:
+        label, x_class, o_class = EXPERIMENT_MATCHUPS[config]
+        start = time.time()
+        results[config] = simulate_games_batch(x_class('X', depth), o_class('O', depth),
+                                               num_games, opening_moves, seed)
+        print(f"[{label}] {num_games} partidas em {time.time() - start:.2f}s")
+    return results